@@ -5,6 +5,9 @@ from BaseClasses import Item, Item
 from BaseClasses import ItemClassification as IC
 from worlds.AutoWorld import World
 
+if TYPE_CHECKING:
+    from . import TPWorld
+
 # from .Randomizer.Dungeons import Dungeon
 
 
@@ -82,27 +85,32 @@ class TPItem(Item):
 
 
 def item_factory(
-    items: Union[str, Iterable[str]], world: World
+    items: Union[str, Iterable[str]], world: "TPWorld"
 ) -> Union[TPItem, list[TPItem]]:
     """
     Create items based on their names.
     Depending on the input, this function can return a single item or a list of items.
+    Every name is checked and classified once, no matter how many of that item are created.
 
     :param items: The name or names of the items to create.
     :param world: The game world.
     :raises KeyError: If an unknown item name is provided.
     :return: A single item or a list of items.
     """
-    ret: list[TPItem] = []
-    singleton = False
-    if isinstance(items, str):
-        items = [items]
-        singleton = True
-    for item in items:
-        if item in ITEM_TABLE:
-            ret.append(world.create_item(item))
-        else:
-            raise KeyError(f"Unknown item {item}")
+    singleton = isinstance(items, str)
+    names = [items] if singleton else list(items)
+
+    classifications: dict[str, Optional[IC]] = {}
+    for name in names:
+        if name not in classifications:
+            if name not in ITEM_TABLE:
+                raise KeyError(f"Unknown item {name}")
+            classifications[name] = world.get_item_classification(name)
+
+    player = world.player
+    ret = [
+        TPItem(name, player, ITEM_TABLE[name], classifications[name]) for name in names
+    ]
 
     return ret[0] if singleton else ret
 
@@ -490,3 +498,25 @@ GoldenBugs = [
     "Male Dayfly",
     "Female Dayfly",
 ]
+
+# Items that are only placed as events for the logic (see ItemPool.py), so they are not in ITEM_TABLE
+LOGIC_ONLY_ITEMS = [
+    "Diababa Defeated",
+    "Fyrus Defeated",
+    "Morpheel Defeated",
+    "Stallord Defeated",
+    "Blizzeta Defeated",
+    "Armogohma Defeated",
+    "Argorok Defeated",
+    "Zant Defeated",
+    "Renado's Letter",
+    "Invoice",
+    "Wooden Statue",
+    "Ilias Charm",
+    "Horse Call",
+]
+
+# Index of every item the logic can count, used for the item count vector kept on CollectionState
+TP_ITEM_INDEX: dict[str, int] = {
+    name: index for index, name in enumerate([*ITEM_TABLE, *LOGIC_ONLY_ITEMS])
+}
@@ -4560,6 +4560,19 @@ LOCATION_TABLE = {
     ),
 }
 
+
+def _get_stage_to_locations() -> dict[TPStages, tuple[tuple[str, Optional[int]], ...]]:
+    stage_to_locations: dict[TPStages, list[tuple[str, Optional[int]]]] = {
+        stage: [] for stage in TPStages
+    }
+    for location_name, data in LOCATION_TABLE.items():
+        stage_to_locations[data.stage_id].append((location_name, data.code))
+    return {stage: tuple(locations) for stage, locations in stage_to_locations.items()}
+
+
+# Every location of each stage as (location name, location code), in LOCATION_TABLE order
+STAGE_TO_LOCATIONS = _get_stage_to_locations()
+
 # A dictionary of every location to it's region. Could be part of location Data however i'm lazy
 LOCATION_TO_REGION: dict[str, str] = {
     "Arbiters Grounds Entrance Chest": "Arbiters Grounds Entrance",
@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING, NamedTuple
+
+from BaseClasses import Region
+from ..Locations import LOCATION_TABLE, LOCATION_TO_REGION, TPLocationData
+from ..Randomizer.Cache import cache_by
+from .RegionConnection import REGION_CONNECTIONS
+from .RegionCreation import REGION_NAMES
+
+if TYPE_CHECKING:
+    from .. import TPWorld
+
+
+class TPGraphTemplate(NamedTuple):
+    """
+    The option independent part of the world graph with every name already resolved.
+
+    Built once per process and shared by every TP world.
+    """
+
+    region_names: tuple[str, ...]
+    # (source region index, target region index, entrance name)
+    connections: tuple[tuple[int, int, str], ...]
+    # (region index, location name, location data) in LOCATION_TABLE order
+    locations: tuple[tuple[int, str, TPLocationData], ...]
+
+
+@cache_by(lambda: None)
+def get_graph_template() -> TPGraphTemplate:
+    """Get the graph template, it is the same for every world so it is only built once."""
+    region_index = {name: index for index, name in enumerate(REGION_NAMES)}
+    assert len(region_index) == len(
+        REGION_NAMES
+    ), f"[Twilight Princess] duplicate regions in {REGION_NAMES=}"
+
+    connections = []
+    for source, target in REGION_CONNECTIONS:
+        assert (
+            source in region_index and target in region_index
+        ), f"[Twilight Princess] {source=} -> {target=} connects an unknown region"
+        connections.append(
+            (region_index[source], region_index[target], f"{source} -> {target}")
+        )
+
+    locations = []
+    for location_name, data in LOCATION_TABLE.items():
+        assert (
+            location_name in LOCATION_TO_REGION
+        ), f"[Twilight Princess] {location_name=} is not in location to region table"
+        region_name = LOCATION_TO_REGION[location_name]
+        assert (
+            region_name in region_index
+        ), f"[Twilight Princess] {region_name=} is not in multiworld regions"
+        locations.append((region_index[region_name], location_name, data))
+
+    return TPGraphTemplate(REGION_NAMES, tuple(connections), tuple(locations))
+
+
+def create_world_graph(world: "TPWorld") -> list[Region]:
+    """
+    Create and connect every region of the world from the template.
+
+    :return: The regions in template order.
+    """
+    template = get_graph_template()
+    player = world.player
+    multiworld = world.multiworld
+
+    regions = [Region(name, player, multiworld) for name in template.region_names]
+    multiworld.regions.extend(regions)
+
+    for source, target, name in template.connections:
+        regions[source].connect(regions[target], name)
+
+    return regions
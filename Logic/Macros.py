@@ -16,18 +16,16 @@ def can_use(state: CollectionState, player: int, item: str):
 def can_change_time(state: CollectionState, player: int):
     if state.has("Shadow Crystal", player):
         return True
-    else:
-        for room in RoomFunctions.time_flow_rooms:
-            if state.can_reach_region(room, player):
-                return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "time_flow_rooms", RoomFunctions.time_flow_rooms
+    )
 
 
 def can_warp(state: CollectionState, player: int):
     if not state.has("Shadow Crystal", player):
         return False
-    return any(
-        state.can_reach_region(room, player) for room in RoomFunctions.warp_rooms
+    return state._tp_can_reach_any_region(
+        player, "warp_rooms", RoomFunctions.warp_rooms
     )
 
 
@@ -1630,55 +1628,49 @@ def has_bugs(state: CollectionState, player: int, count: int):
 def can_unlock_ordona_map(state: CollectionState, player: int):
     if state._tp_open_map(player):
         return True
-    for mapRoom in RoomFunctions.OrdonaMapRooms:
-        if state.can_reach_region(mapRoom):
-            return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "OrdonaMapRooms", RoomFunctions.OrdonaMapRooms
+    )
 
 
 def can_unlock_faron_map(state: CollectionState, player: int):
     if state._tp_open_map(player):
         return True
-    for mapRoom in RoomFunctions.FaronMapRooms:
-        if state.can_reach_region(mapRoom):
-            return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "FaronMapRooms", RoomFunctions.FaronMapRooms
+    )
 
 
 def can_unlock_eldin_map(state: CollectionState, player: int):
     if state._tp_open_map(player):
         return True
-    for mapRoom in RoomFunctions.EldinMapRooms:
-        if state.can_reach_region(mapRoom):
-            return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "EldinMapRooms", RoomFunctions.EldinMapRooms
+    )
 
 
 def can_unlock_lanayru_map(state: CollectionState, player: int):
     if state._tp_open_map(player):
         return True
-    for mapRoom in RoomFunctions.LanayruMapRooms:
-        if state.can_reach_region(mapRoom):
-            return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "LanayruMapRooms", RoomFunctions.LanayruMapRooms
+    )
 
 
 def can_unlock_snowpeak_map(state: CollectionState, player: int):
     if state._tp_open_map(player) or state._tp_skip_snowpeak_entrance(player):
         return True
-    for mapRoom in RoomFunctions.SnowpeakMapRooms:
-        if state.can_reach_region(mapRoom):
-            return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "SnowpeakMapRooms", RoomFunctions.SnowpeakMapRooms
+    )
 
 
 def can_unlock_gerudo_map(state: CollectionState, player: int):
     if state._tp_open_map(player):
         return True
-    for mapRoom in RoomFunctions.GerudoMapRooms:
-        if state.can_reach_region(mapRoom):
-            return True
-    return False
+    return state._tp_can_reach_any_region(
+        player, "GerudoMapRooms", RoomFunctions.GerudoMapRooms
+    )
 
 
 def can_do_difficult_combat(state: CollectionState, player: int):
@@ -3,6 +3,7 @@ from BaseClasses import Entrance
 from worlds.AutoWorld import World
 from worlds.generic.Rules import set_rule
 from .Macros import *
+from .RuleCompiler import set_compiled_rule
 from ..options import *
 
 if TYPE_CHECKING:
@@ -25,11 +26,11 @@ def set_region_access_rules(world: "TPWorld", player: int):
             and glitched_rule
         ):
             # assert glitched_rule, f"[Twilight Princess] {location=} has no glitched rule"
-            set_rule(exit, glitched_rule)
+            set_compiled_rule(world, exit, glitched_rule)
         # elif world.options.logic_rules.value == LogicRules.option_no_logic:
         #     set_rule(exit, lambda state: (True))
         else:
-            set_rule(exit, rule)
+            set_compiled_rule(world, exit, rule)
 
     set_rule_if_exits(
         world.get_entrance("Arbiters Grounds Entrance -> Outside Arbiters Grounds"),
@@ -0,0 +1,316 @@
+from types import MethodType
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from BaseClasses import CollectionState, Entrance, Location, MultiWorld
+from worlds.generic.Rules import set_rule
+from ..Items import TP_ITEM_INDEX
+from ..Randomizer.Cache import cache_by
+
+if TYPE_CHECKING:
+    from .. import TPWorld
+
+# A clause is a pair of (lower bounds, upper bounds) over TP item counts.
+#   lower: ((item, n), ...) -> state count of item must be >= n
+#   upper: ((item, n), ...) -> state count of item must be < n
+Clause = tuple[tuple[tuple[str, int], ...], tuple[tuple[str, int], ...]]
+# The same as Clause with the items replaced by their TP_ITEM_INDEX, this is what gets evaluated
+IndexedClause = tuple[tuple[tuple[int, int], ...], tuple[tuple[int, int], ...]]
+
+# How many distinct paths through a rule are explored before giving up and keeping the original lambda.
+# Most rules are a handful of paths, the few that are not are large and-chains of or-macros.
+MAX_RULE_PATHS = 128
+
+
+class _ReachQuery(Exception):
+    """Raised by the tracer when a rule asks about region reachability."""
+
+
+class _Uncompilable(Exception):
+    """Raised by the tracer when a rule does something that can't be expressed as item thresholds."""
+
+
+class _RuleTracer:
+    """
+    Stand-in for a CollectionState that answers item questions from a decision list.
+
+    Every new `has` question that isn't implied by previous answers becomes a decision.
+    Replaying a rule with different decision lists walks every path through the rule.
+    """
+
+    def __init__(self, multiworld: MultiWorld, player: int):
+        self.multiworld = multiworld
+        self.player = player
+        self.prefix: list[bool] = []
+        self.decisions: list[bool] = []
+        self.lower: dict[str, int] = {}
+        self.upper: dict[str, int] = {}
+
+    def reset(self, prefix: list[bool]) -> None:
+        self.prefix = prefix
+        self.decisions = []
+        self.lower = {}
+        self.upper = {}
+
+    def clause(self) -> Clause:
+        return (
+            tuple(sorted(self.lower.items())),
+            tuple(sorted(self.upper.items())),
+        )
+
+    def has(self, item: str, player: int, count: int = 1) -> bool:
+        if player != self.player:
+            raise _Uncompilable(f"{item} for {player=}")
+        if count <= self.lower.get(item, 0):
+            return True
+        upper = self.upper.get(item)
+        if upper is not None and count >= upper:
+            return False
+
+        depth = len(self.decisions)
+        value = self.prefix[depth] if depth < len(self.prefix) else False
+        self.decisions.append(value)
+        if value:
+            self.lower[item] = count
+        else:
+            self.upper[item] = count
+        return value
+
+    def has_any(self, items, player: int) -> bool:
+        return any(self.has(item, player) for item in items)
+
+    def has_all(self, items, player: int) -> bool:
+        return all(self.has(item, player) for item in items)
+
+    def can_reach_region(self, region: str, player: Optional[int] = None) -> bool:
+        raise _ReachQuery(region)
+
+    def can_reach(self, spot, resolution_hint=None, player=None) -> bool:
+        raise _ReachQuery(spot)
+
+    def _tp_can_reach_any_region(self, player: int, key: str, regions) -> bool:
+        raise _ReachQuery(key)
+
+    def __getattr__(self, name: str):
+        # Option helpers from the TP logic mixin only read options, so they are constant for the world
+        if name.startswith("_tp_"):
+            return MethodType(getattr(CollectionState, name), self)
+        raise _Uncompilable(name)
+
+
+def _explore(
+    rule: Callable[[CollectionState], bool], tracer: _RuleTracer
+) -> Optional[tuple[list[Clause], list[Clause]]]:
+    """
+    Walk every path through the rule.
+
+    :return: The clauses of paths that return True and the clauses of paths that asked about reachability,
+    or None if the rule could not be compiled.
+    """
+    clauses: list[Clause] = []
+    gates: list[Clause] = []
+    prefix: list[bool] = []
+
+    for _ in range(MAX_RULE_PATHS):
+        tracer.reset(prefix)
+        try:
+            if rule(tracer):
+                clauses.append(tracer.clause())
+        except _ReachQuery:
+            gates.append(tracer.clause())
+        except Exception:
+            # Anything else (unknown state methods, bad helpers, other players) keeps the original rule
+            return None
+
+        # Backtrack to the deepest decision that has not been tried as True yet
+        decisions = tracer.decisions
+        while decisions and decisions[-1]:
+            decisions.pop()
+        if not decisions:
+            return clauses, gates
+        prefix = decisions[:-1] + [True]
+
+    return None
+
+
+def _subsumes(general: Clause, specific: Clause) -> bool:
+    """True if every state matching `specific` also matches `general`."""
+    specific_lower = dict(specific[0])
+    specific_upper = dict(specific[1])
+    for item, count in general[0]:
+        if specific_lower.get(item, 0) < count:
+            return False
+    for item, count in general[1]:
+        if item not in specific_upper or specific_upper[item] > count:
+            return False
+    return True
+
+
+def _simplify(clauses: list[Clause]) -> list[Clause]:
+    # Shortest clauses first so the cheapest checks run first at evaluation time
+    clauses = sorted(set(clauses), key=lambda clause: (len(clause[0]) + len(clause[1])))
+    kept: list[Clause] = []
+    for clause in clauses:
+        if not any(_subsumes(other, clause) for other in kept):
+            kept.append(clause)
+    return kept
+
+
+def _index_clause(clause: Clause) -> IndexedClause:
+    return (
+        tuple((TP_ITEM_INDEX[item], count) for item, count in clause[0]),
+        tuple((TP_ITEM_INDEX[item], count) for item, count in clause[1]),
+    )
+
+
+def _matches(counts: list[int], clause: IndexedClause) -> bool:
+    for index, count in clause[0]:
+        if counts[index] < count:
+            return False
+    for index, count in clause[1]:
+        if counts[index] >= count:
+            return False
+    return True
+
+
+def _register_dependencies(world: "TPWorld", clauses: tuple[IndexedClause, ...]) -> int:
+    """
+    Give a rule its bit in the known false mask of the state and mark it as depending on every item it checks.
+
+    :return: The bit of the rule.
+    """
+    rule_bit = 1 << world.compiled_rule_count
+    world.compiled_rule_count += 1
+    for lower, upper in clauses:
+        for index, _ in (*lower, *upper):
+            world.item_rule_masks[index] |= rule_bit
+    return rule_bit
+
+
+def _build(
+    world: "TPWorld",
+    clauses: tuple[Clause, ...],
+    gates: tuple[Clause, ...],
+    fallback: Callable[[CollectionState], bool],
+) -> Callable[[CollectionState], bool]:
+    if any(
+        item not in TP_ITEM_INDEX
+        for clause in (*clauses, *gates)
+        for bounds in clause
+        for item, _ in bounds
+    ):
+        # Only items in the index are counted on the state
+        return fallback
+
+    player = world.player
+    indexed_clauses = tuple(_index_clause(clause) for clause in clauses)
+    indexed_gates = tuple(_index_clause(clause) for clause in gates)
+
+    if not indexed_gates:
+        # Only depends on items, once False it stays False until one of its items is collected or removed
+        rule_bit = _register_dependencies(world, indexed_clauses)
+
+        def compiled_rule(state: CollectionState) -> bool:
+            if state._tp_known_false[player] & rule_bit:
+                return False
+            counts = state._tp_item_counts[player]
+            for clause in indexed_clauses:
+                if _matches(counts, clause):
+                    return True
+            state._tp_known_false[player] |= rule_bit
+            return False
+
+    else:
+
+        def compiled_rule(state: CollectionState) -> bool:
+            counts = state._tp_item_counts[player]
+            for clause in indexed_clauses:
+                if _matches(counts, clause):
+                    return True
+            # The paths are disjoint, so at most one gate can match and only then does reachability matter
+            for gate in indexed_gates:
+                if _matches(counts, gate):
+                    return fallback(state)
+            return False
+
+    compiled_rule.tp_source = fallback
+    compiled_rule.tp_clauses = tuple(clauses)
+    compiled_rule.tp_gates = tuple(gates)
+    return compiled_rule
+
+
+def _compile_clauses(
+    world: "TPWorld", rule: Callable[[CollectionState], bool]
+) -> Optional[tuple[tuple[Clause, ...], tuple[Clause, ...]]]:
+    """Trace a rule into its clauses and gates, None if it could not be compiled."""
+    explored = _explore(rule, _RuleTracer(world.multiworld, world.player))
+    if explored is None:
+        return None
+    clauses, gates = explored
+    return tuple(_simplify(clauses)), tuple(gates)
+
+
+# Rules that only capture the player compile the same for every world with the same option profile.
+# The clauses name items only, so they are the same for every player.
+_compile_shared_clauses = cache_by(
+    lambda world, rule: (rule.__code__, world.option_profile)
+)(_compile_clauses)
+
+
+def compile_rule(
+    world: "TPWorld", rule: Callable[[CollectionState], bool]
+) -> Callable[[CollectionState], bool]:
+    """
+    Compile a TP logic rule into DNF clauses over item count thresholds.
+
+    Option reads are folded while tracing, so branches for other settings (like glitched only paths) are dropped.
+    Paths that ask about region reachability keep calling the original rule.
+    Rules that can't be traced (or are too big) are returned unchanged.
+    The result is reused for the same rule in worlds with the same option profile.
+
+    :param world: The world the rule belongs to.
+    :param rule: The rule to compile.
+    :return: A rule that gives the same answer as the original.
+    """
+    if (
+        set(rule.__code__.co_freevars) <= {"player"}
+        and rule.__defaults__ is None
+        and world.option_profile is not None
+    ):
+        compiled = _compile_shared_clauses(world, rule)
+    else:
+        compiled = _compile_clauses(world, rule)
+
+    if compiled is None:
+        return rule
+    return _build(world, *compiled, rule)
+
+
+def is_always_true(rule: Callable[[CollectionState], bool]) -> bool:
+    """
+    Check if a rule is True for every state.
+
+    :param rule: The rule to check.
+    :return: True for the default rule and compiled rules with a path that does not check anything.
+    """
+    if rule is Entrance.access_rule or rule is Location.access_rule:
+        return True
+    return ((), ()) in getattr(rule, "tp_clauses", ())
+
+
+def set_compiled_rule(
+    world: "TPWorld",
+    spot: Union[Location, Entrance],
+    rule: Callable[[CollectionState], bool],
+) -> None:
+    """
+    Compile a rule and set it on a location or entrance.
+
+    Rules that are always True (also after folding the options) are not set,
+    the spot keeps the default rule and is counted in the world's logic stats.
+    """
+    compiled = compile_rule(world, rule)
+    world.logic_stats["rules"] += 1
+    if is_always_true(compiled):
+        world.logic_stats["trivial_rules"] += 1
+        return
+    set_rule(spot, compiled)
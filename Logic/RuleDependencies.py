@@ -0,0 +1,140 @@
+from types import CodeType, FunctionType
+from typing import TYPE_CHECKING, Callable, Optional
+
+from BaseClasses import CollectionState
+
+if TYPE_CHECKING:
+    from .. import TPWorld
+
+# State methods that make a rule depend on another region being reachable
+REACH_METHODS = frozenset(["can_reach_region", "can_reach", "_tp_can_reach_any_region"])
+
+# Function -> if it checks reachability and the strings it could pass to those checks
+DependencyCache = dict[FunctionType, tuple[bool, frozenset[str]]]
+
+
+def _get_code_objects(code: CodeType):
+    """Yield the code object and every nested code object (lambdas, generator expressions)."""
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _get_code_objects(const)
+
+
+def _get_strings(value) -> set[str]:
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, (list, tuple, set, frozenset)) and all(
+        isinstance(entry, str) for entry in value
+    ):
+        return set(value)
+    return set()
+
+
+def _get_function_dependencies(
+    function: FunctionType, cache: DependencyCache, visiting: set[FunctionType]
+) -> tuple[bool, frozenset[str]]:
+    """
+    Statically collect what a function can ask about.
+
+    :param function: The function to scan.
+    :param cache: Results of the functions already scanned.
+    :param visiting: The functions being scanned further up the call chain.
+    :return: If the function (or anything it calls) checks reachability,
+    and every string it (or anything it calls) could pass to those checks.
+    """
+    if function in cache:
+        return cache[function]
+    if function in visiting:
+        # Recursive macro, the outer call collects everything
+        return False, frozenset()
+    visiting.add(function)
+
+    uses_reach = False
+    strings: set[str] = set()
+    callees: list[FunctionType] = []
+
+    # Closures made from the same code can capture different functions, regions and room lists
+    for cell in function.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            # Cell that has not been assigned yet
+            continue
+        if isinstance(value, FunctionType):
+            callees.append(value)
+        else:
+            strings.update(_get_strings(value))
+
+    for code_object in _get_code_objects(function.__code__):
+        for const in code_object.co_consts:
+            strings.update(_get_strings(const))
+        for name in code_object.co_names:
+            if name in REACH_METHODS:
+                uses_reach = True
+            value = function.__globals__.get(name)
+            if isinstance(value, FunctionType):
+                callees.append(value)
+            elif isinstance(value, type):
+                # Room lists are looked up as class attributes (e.g. RoomFunctions.warp_rooms)
+                for attribute in code_object.co_names:
+                    strings.update(_get_strings(getattr(value, attribute, None)))
+            else:
+                strings.update(_get_strings(value))
+
+    for callee in callees:
+        callee_uses_reach, callee_strings = _get_function_dependencies(
+            callee, cache, visiting
+        )
+        uses_reach |= callee_uses_reach
+        strings.update(callee_strings)
+
+    visiting.discard(function)
+    result = (uses_reach, frozenset(strings))
+    cache[function] = result
+    return result
+
+
+def get_region_dependencies(
+    world: "TPWorld",
+    rule: Callable[[CollectionState], bool],
+    cache: Optional[DependencyCache] = None,
+) -> set[str]:
+    """
+    Find the regions a rule could check the reachability of.
+
+    The result may contain more regions than the rule actually checks but never fewer.
+
+    :param world: The world the rule belongs to.
+    :param rule: The rule to check, compiled rules are checked through their source rule.
+    :param cache: Results to reuse between the rules of the world.
+    :return: The names of the regions of the world the rule depends on.
+    """
+    rule = getattr(rule, "tp_source", rule)
+    assert isinstance(rule, FunctionType), f"[Twilight Princess] {rule=}"
+
+    uses_reach, strings = _get_function_dependencies(
+        rule, {} if cache is None else cache, set()
+    )
+    if not uses_reach:
+        return set()
+
+    region_names = world.multiworld.regions.region_cache[world.player]
+    return {name for name in strings if name in region_names}
+
+
+def register_indirect_conditions(world: "TPWorld") -> None:
+    """
+    Register every region an entrance rule depends on as an indirect condition of that entrance.
+
+    This is what allows the world to use explicit indirect conditions.
+    """
+    cache: DependencyCache = {}
+    for region in world.multiworld.get_regions(world.player):
+        for entrance in region.exits:
+            for dependency in get_region_dependencies(
+                world, entrance.access_rule, cache
+            ):
+                world.multiworld.register_indirect_condition(
+                    world.get_region(dependency), entrance
+                )
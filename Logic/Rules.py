@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterable, NamedTuple
 
 from BaseClasses import CollectionState, MultiWorld
 from worlds.AutoWorld import LogicMixin
@@ -11,6 +11,8 @@ from ..options import (
     TotEntrance,
 )
 from .Macros import *
+from .RuleCompiler import set_compiled_rule
+from ..Items import TP_ITEM_INDEX
 from ..Locations import LOCATION_TABLE
 
 if TYPE_CHECKING:
@@ -21,32 +23,88 @@ class TPLogic(LogicMixin):
 
     multiworld: MultiWorld
 
+    # Bumped every time a TP item is collected or removed for the player
+    _tp_item_version: dict[int, int]
+    # Count of every collected TP item by TP_ITEM_INDEX, mirrors prog_items
+    _tp_item_counts: dict[int, list[int]]
+    # Bit mask of compiled rules that were False, cleared for a rule when one of its items changes
+    _tp_known_false: dict[int, int]
+    # Results of room set reachability checks, macro key -> (item version, reachable region count, result)
+    _tp_reach_memo: dict[int, dict[str, tuple[int, int, bool]]]
+
+    def init_mixin(self, multiworld: MultiWorld) -> None:
+        players = multiworld.get_game_players("Twilight Princess")
+        self._tp_item_version = {player: 0 for player in players}
+        self._tp_item_counts = {player: [0] * len(TP_ITEM_INDEX) for player in players}
+        self._tp_known_false = {player: 0 for player in players}
+        self._tp_reach_memo = {player: {} for player in players}
+
+    def copy_mixin(self, ret: CollectionState) -> CollectionState:
+        ret._tp_item_version = self._tp_item_version.copy()
+        ret._tp_item_counts = {
+            player: counts.copy() for player, counts in self._tp_item_counts.items()
+        }
+        ret._tp_known_false = self._tp_known_false.copy()
+        ret._tp_reach_memo = {
+            player: memo.copy() for player, memo in self._tp_reach_memo.items()
+        }
+        return ret
+
+    def _tp_can_reach_any_region(
+        self, player: int, key: str, regions: Iterable[str]
+    ) -> bool:
+        """
+        Check if any region of a room set can be reached.
+
+        The result is kept until an item is collected/removed or more regions become reachable.
+        Reachable regions only grow while the items stay the same, so the region count is enough to detect changes.
+        """
+        if self.stale[player]:
+            self.update_reachable_regions(player)
+        reachable_regions = self.reachable_regions[player]
+        version = self._tp_item_version[player]
+        region_count = len(reachable_regions)
+
+        memo = self._tp_reach_memo[player]
+        cached = memo.get(key)
+        if cached is not None and cached[0] == version:
+            # A reachable region stays reachable until the items change
+            if cached[2] or cached[1] == region_count:
+                return cached[2]
+
+        result = any(
+            self.multiworld.get_region(region, player) in reachable_regions
+            for region in regions
+        )
+        memo[key] = (version, region_count, result)
+        return result
+
     def _tp_glitched(self, player: int) -> bool:
         return (
-            self.multiworld.worlds[player].options.logic_rules.value
+            self.multiworld.worlds[player].option_profile.logic_rules
             == LogicRules.option_glitched
         )
 
     def _tp_shops_shuffled(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.shop_items_shuffled.value
+        return self.multiworld.worlds[player].option_profile.shop_items_shuffled
 
     def _tp_is_small_key_anywhere(self, player: int) -> bool:
         return (
-            self.multiworld.worlds[player].options.small_key_settings.value
+            self.multiworld.worlds[player].option_profile.small_key_settings
             == SmallKeySettings.option_anywhere
         )
 
     def _tp_is_big_key_anywhere(self, player: int) -> bool:
         return (
-            self.multiworld.worlds[player].options.big_key_settings.value
+            self.multiworld.worlds[player].option_profile.big_key_settings
             == BigKeySettings.option_anywhere
         )
 
     def _tp_small_key_settings(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.small_key_settings.value
+        return self.multiworld.worlds[player].option_profile.small_key_settings
 
     def _tp_big_key_settings(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.big_key_settings.value
+        return self.multiworld.worlds[player].option_profile.big_key_settings
 
     # def _tp_skip_prologue(self, player: int) -> bool:
     #     return self.multiworld.worlds[player].options.skip_prologue.value
@@ -66,51 +124,84 @@ class TPLogic(LogicMixin):
     def _tp_skip_arbiters_entrance(self, player: int) -> bool:
         return self.multiworld.worlds[
             player
-        ].options.skip_arbiters_grounds_entrance.value
+        ].option_profile.skip_arbiters_grounds_entrance
 
     def _tp_skip_lakebed_entrance(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.skip_lakebed_entrance.value
+        return self.multiworld.worlds[player].option_profile.skip_lakebed_entrance
 
     def _tp_skip_city_in_the_sky_entrance(self, player: int) -> bool:
         return self.multiworld.worlds[
             player
-        ].options.skip_city_in_the_sky_entrance.value
+        ].option_profile.skip_city_in_the_sky_entrance
 
     def _tp_skip_snowpeak_entrance(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.skip_snowpeak_entrance.value
+        return self.multiworld.worlds[player].option_profile.skip_snowpeak_entrance
 
     def _tp_tot_entrance(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.tot_entrance.value
+        return self.multiworld.worlds[player].option_profile.tot_entrance
 
     def _tp_palace_requirements(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.palace_requirements.value
+        return self.multiworld.worlds[player].option_profile.palace_requirements
 
     def _tp_castle_requirements(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.castle_requirements.value
+        return self.multiworld.worlds[player].option_profile.castle_requirements
 
     def _tp_goron_mines_enterance(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.goron_mines_entrance.value
+        return self.multiworld.worlds[player].option_profile.goron_mines_entrance
 
     def _tp_faron_woods_logic(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.faron_woods_logic.value
+        return self.multiworld.worlds[player].option_profile.faron_woods_logic
 
     def _tp_open_map(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.open_map.value
+        return self.multiworld.worlds[player].option_profile.open_map
 
     # def _tp_barren_dungeons(self, player: int) -> bool:
     #     return self.multiworld.worlds[player].options.barren_dungeons.value
 
     def _tp_increase_wallet(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.increase_wallet.value
+        return self.multiworld.worlds[player].option_profile.increase_wallet
 
     def _tp_bonks_do_damage(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.bonks_do_damage.value
+        return self.multiworld.worlds[player].option_profile.bonks_do_damage
 
     def _tp_damage_magnification(self, player: int) -> int:
-        return self.multiworld.worlds[player].options.damage_magnification.value
+        return self.multiworld.worlds[player].option_profile.damage_magnification
 
     def _tp_transform_anywhere(self, player: int) -> bool:
-        return self.multiworld.worlds[player].options.transform_anywhere.value
+        return self.multiworld.worlds[player].option_profile.transform_anywhere
+
+
+class TPOptionProfile(NamedTuple):
+    """
+    The values of every option the logic reads.
+
+    Taken at the end of generate_early, the options do not change after that.
+    """
+
+    logic_rules: int
+    shop_items_shuffled: int
+    small_key_settings: int
+    big_key_settings: int
+    skip_arbiters_grounds_entrance: int
+    skip_lakebed_entrance: int
+    skip_city_in_the_sky_entrance: int
+    skip_snowpeak_entrance: int
+    tot_entrance: int
+    palace_requirements: int
+    castle_requirements: int
+    goron_mines_entrance: int
+    faron_woods_logic: int
+    open_map: int
+    increase_wallet: int
+    bonks_do_damage: int
+    damage_magnification: int
+    transform_anywhere: int
+
+
+def get_option_profile(world: "TPWorld") -> TPOptionProfile:
+    return TPOptionProfile(
+        *[getattr(world.options, field).value for field in TPOptionProfile._fields]
+    )
 
 
 def set_location_access_rules(world: "TPWorld"):
@@ -129,11 +220,11 @@ def set_location_access_rules(world: "TPWorld"):
             and glitched_rule
         ):
             # assert glitched_rule, f"{location=} has no glitched rule"
-            set_rule(location, glitched_rule)
+            set_compiled_rule(world, location, glitched_rule)
         # elif world.options.logic_rules.value == LogicRules.option_no_logic:
         #     set_rule(exit, lambda state: (True))
         else:
-            set_rule(location, rule)
+            set_compiled_rule(world, location, rule)
 
     player = world.player
 
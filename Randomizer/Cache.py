@@ -0,0 +1,33 @@
+from functools import wraps
+from typing import Callable, Dict, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+def cache_by(
+    key: Callable[..., Hashable],
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    Cache the results of a function under key(*args) instead of the arguments themselves.
+
+    For results that only depend on part of a world, like its option profile. Only use it with keys that
+    have a small number of values and results that can't be changed (tuples, frozensets).
+
+    :param key: Makes the cache key from the arguments of the function.
+    :return: The decorator.
+    """
+
+    def decorator(function: Callable[..., R]) -> Callable[..., R]:
+        results: Dict[Hashable, R] = {}
+
+        @wraps(function)
+        def cached(*args) -> R:
+            cache_key = key(*args)
+            if cache_key not in results:
+                results[cache_key] = function(*args)
+            return results[cache_key]
+
+        cached.cache_clear = results.clear
+        return cached
+
+    return decorator
@@ -0,0 +1,331 @@
+import logging
+import time
+from typing import TYPE_CHECKING, List
+
+from BaseClasses import CollectionState, Item, Location, LocationProgressType
+from Fill import FillError, fill_restrictive
+from ..Locations import TPStages
+from ..options import CastleRequirements, FaronWoodsLogic, PalaceRequirements
+from .ItemPool import (
+    DUNGEON_TO_BOSS_NAME,
+    VANILLA_BIG_KEY_LOCATIONS,
+    VANILLA_MAP_AND_COMPASS_LOCATIONS,
+    VANILLA_SMALL_KEYS_LOCATIONS,
+    PrefillPool,
+)
+
+if TYPE_CHECKING:
+    from .. import TPWorld
+
+# How many more times the dungeon items are placed, with a new shuffle, when placing them fails.
+# This is work done by the generating host so it is not a player option.
+PREFILL_RETRIES = 2
+
+
+def _collect_placed(state: CollectionState, placements: List[Location]) -> None:
+    """Collect the items already placed by the dungeon fill that can be reached, the only sweep the fill needs."""
+    collected: set = set()
+    changed = True
+    while changed:
+        changed = False
+        for location in placements:
+            if location not in collected and location.can_reach(state):
+                collected.add(location)
+                state.collect(location.item, True, location)
+                changed = True
+
+
+def _find_location(
+    state: CollectionState,
+    locations: List[Location],
+    item: Item,
+    allow_excluded: bool,
+) -> int:
+    """Find the first location the item can go in, excluded locations are only used when nothing else is left."""
+    for index, location in enumerate(locations):
+        if location.can_fill(state, item):
+            return index
+    if allow_excluded:
+        for index, location in enumerate(locations):
+            if (
+                location.progress_type == LocationProgressType.EXCLUDED
+                and location.item_rule(item)
+                and location.can_reach(state)
+            ):
+                return index
+    return -1
+
+
+def fill_dungeon(
+    state: CollectionState,
+    locations: List[Location],
+    items: List[Item],
+    allow_excluded: bool = False,
+) -> bool:
+    """
+    Place a dungeon's items in its own locations with an assumed fill that only looks inside the dungeon.
+
+    Works like fill_restrictive: items are taken from the end of the list and go in the first location
+    (in the already shuffled order) that can be reached with every item not yet placed.
+    Instead of sweeping the whole multiworld for every item only the items this fill placed are swept,
+    everything else the dungeon needs is already in the state. Not sweeping anything else can only make
+    fewer locations reachable so the placements are still valid, they just fail a bit more often.
+
+    :param state: The state to place the items with, it is not changed.
+    :param locations: The empty locations of the dungeon in the order to try them, placed locations are removed.
+    :param items: The items to place, emptied when every item is placed.
+    :param allow_excluded: If excluded locations can be used when there is nowhere else.
+    :return: If every item was placed, when False nothing is placed and the lists are unchanged.
+    """
+    unplaced = list(items)
+    open_locations = list(locations)
+    placements: List[Location] = []
+
+    while unplaced:
+        item = unplaced.pop()
+
+        assumed_state = state.copy()
+        for assumed_item in unplaced:
+            assumed_state.collect(assumed_item, True)
+        _collect_placed(assumed_state, placements)
+
+        index = _find_location(assumed_state, open_locations, item, allow_excluded)
+        if index < 0:
+            # Undo everything so the caller can fall back to fill_restrictive
+            for location in placements:
+                location.item.location = None
+                location.item = None
+                location.locked = False
+            return False
+
+        location = open_locations.pop(index)
+        location.place_locked_item(item)
+        placements.append(location)
+
+    placed = set(placements)
+    locations[:] = [location for location in locations if location not in placed]
+    items.clear()
+    return True
+
+
+def _undo_placements(
+    locations: List[Location], progress_types: List[LocationProgressType]
+) -> None:
+    # fill_restrictive with allow_excluded can raise before it puts back excluded locations
+    for location, progress_type in zip(locations, progress_types):
+        location.progress_type = progress_type
+        if location.item is not None:
+            location.item.location = None
+            location.item = None
+            location.locked = False
+
+
+def place_dungeon_items(
+    world: "TPWorld",
+    state: CollectionState,
+    locations: List[Location],
+    items: List[Item],
+    description: str,
+    local: bool,
+) -> None:
+    """
+    Place dungeon items, retrying with a fresh shuffle when the fill fails.
+
+    A failed attempt is undone (every location it filled is emptied again) and the items and locations
+    are shuffled again, up to PREFILL_RETRIES more times. Neither fill changes the state
+    so it is reused as is for every attempt.
+
+    :param world: The world the items are placed for.
+    :param state: The state to place the items with.
+    :param locations: The empty locations the items can go in, already shuffled.
+    :param items: The items to place, emptied when every item is placed.
+    :param description: What is being placed, for the log.
+    :param local: If the dungeon local fill should be tried before fill_restrictive.
+    :raises FillError: When every attempt failed.
+    """
+    all_locations = list(locations)
+    all_items = list(items)
+    progress_types = [location.progress_type for location in all_locations]
+    attempts = PREFILL_RETRIES + 1
+
+    for attempt in range(1, attempts + 1):
+        start = time.perf_counter()
+        try:
+            if not (
+                local and fill_dungeon(state, locations, items, allow_excluded=True)
+            ):
+                if local:
+                    logging.debug(
+                        f"[Twilight Princess] Dungeon fill failed for {description}, using fill_restrictive"
+                    )
+                fill_restrictive(
+                    world.multiworld,
+                    state,
+                    locations,
+                    items,
+                    single_player_placement=True,
+                    lock=True,
+                    allow_excluded=True,
+                )
+            if not items:
+                # Only worth more than a debug message when the first attempt failed
+                logging.log(
+                    logging.INFO if attempt > 1 else logging.DEBUG,
+                    f"[Twilight Princess] Player {world.player} placed {description} on attempt {attempt} "
+                    f"in {time.perf_counter() - start:.3f}s",
+                )
+                return
+            error = FillError(f"[Twilight Princess] Not all items placed {items=}")
+        except FillError as fill_error:
+            error = fill_error
+
+        logging.warning(
+            f"[Twilight Princess] Player {world.player} failed to place {description}, "
+            f"attempt {attempt}/{attempts} took {time.perf_counter() - start:.3f}s: {error}"
+        )
+        _undo_placements(all_locations, progress_types)
+        if attempt == attempts:
+            raise error
+
+        items[:] = all_items
+        locations[:] = all_locations
+        world.multiworld.random.shuffle(items)
+        world.multiworld.random.shuffle(locations)
+
+
+def get_own_dungeon_exceptions(world: "TPWorld") -> List[str]:
+    """
+    Get the dungeons that any_dungeon items are placed in on their own.
+
+    These dungeons need bosses from other dungeons (or Diababa when Faron Woods is closed) to be completed,
+    so their items are placed after the rest with those bosses defeated.
+    """
+    dungeons = []
+    if world.options.castle_requirements.value in [
+        CastleRequirements.option_vanilla,
+        CastleRequirements.option_all_dungeons,
+    ]:
+        dungeons.append("Hyrule Castle")
+    if world.options.palace_requirements.value == PalaceRequirements.option_vanilla:
+        dungeons.append("Palace of Twilight")
+    if world.options.faron_woods_logic == FaronWoodsLogic.option_closed:
+        dungeons.append("Forest Temple")
+    return dungeons
+
+
+def get_required_boss_items(world: "TPWorld", dungeon_name: str) -> List[Item]:
+    """
+    Get the boss defeat events a dungeon needs before it can be completed.
+
+    :param world: The world to get the events of.
+    :param dungeon_name: The dungeon, only Palace of Twilight and Hyrule Castle need other bosses.
+    :return: The events to collect into the state the dungeon's items are placed with.
+    """
+    if dungeon_name == "Palace of Twilight":
+        if world.options.palace_requirements.value == PalaceRequirements.option_vanilla:
+            return [world.boss_defeat_items[DUNGEON_TO_BOSS_NAME["City in The Sky"]]]
+    elif dungeon_name == "Hyrule Castle":
+        if (
+            world.options.castle_requirements.value
+            == CastleRequirements.option_all_dungeons
+        ):
+            return list(world.boss_defeat_items.values())
+        elif (
+            world.options.castle_requirements.value == CastleRequirements.option_vanilla
+        ):
+            return [world.boss_defeat_items[DUNGEON_TO_BOSS_NAME["Palace of Twilight"]]]
+    return []
+
+
+def check_prefill_feasibility(world: "TPWorld", pre_fill_items: PrefillPool) -> None:
+    """
+    Check that the dungeon items can fit in the dungeons before any of them are placed.
+
+    Item and location counts are compared, and the bosses a dungeon is filled with as defeated
+    have to be reachable with every item. Anything it rejects can never be filled,
+    passing does not mean the fill will succeed.
+
+    :param world: The world to check, everything that is not a dungeon item should already be placed.
+    :param pre_fill_items: The items that still need to be placed.
+    :raises FillError: When the dungeon items can't fit.
+    """
+    categories = [
+        (world.options.small_key_settings, VANILLA_SMALL_KEYS_LOCATIONS),
+        (world.options.big_key_settings, VANILLA_BIG_KEY_LOCATIONS),
+        (world.options.map_and_compass_settings, VANILLA_MAP_AND_COMPASS_LOCATIONS),
+    ]
+    exceptions = get_own_dungeon_exceptions(world)
+
+    # Empty locations left in each dungeon once the vanilla items are placed
+    free: dict[str, int] = {}
+    # Items that have to go in each dungeon
+    own: dict[str, int] = {}
+    any_dungeon = 0
+
+    for option, vanilla in categories:
+        if not option.in_dungeon:
+            continue
+        for dungeon_name, dungeon_items in vanilla.items():
+            if dungeon_name not in free:
+                free[dungeon_name] = sum(
+                    location.item is None and location.address is not None
+                    for location in world.get_stage_locations(TPStages(dungeon_name))
+                )
+                own[dungeon_name] = 0
+
+            for item_name, vanilla_locations in dungeon_items.items():
+                count = pre_fill_items.count(item_name)
+                if option.value == option.option_vanilla:
+                    for location_name in vanilla_locations:
+                        location = world.get_location(location_name)
+                        if location.item is not None or location.address is None:
+                            raise FillError(
+                                f"[Twilight Princess] Vanilla location {location_name} for {item_name} is not available for player {world.player}"
+                            )
+                    free[dungeon_name] -= len(vanilla_locations)
+                elif (
+                    option.value == option.option_own_dungeon
+                    or dungeon_name in exceptions
+                ):
+                    own[dungeon_name] += count
+                else:
+                    any_dungeon += count
+
+    for dungeon_name in free:
+        if own[dungeon_name] > free[dungeon_name]:
+            raise FillError(
+                f"[Twilight Princess] {dungeon_name} has {free[dungeon_name]} locations for {own[dungeon_name]} own dungeon items for player {world.player}"
+            )
+
+    shared = sum(
+        free[dungeon_name] - own[dungeon_name]
+        for dungeon_name in free
+        if dungeon_name not in exceptions
+    )
+    if any_dungeon > shared:
+        raise FillError(
+            f"[Twilight Princess] The dungeons have {shared} locations for {any_dungeon} any dungeon items for player {world.player}"
+        )
+
+    # Palace of Twilight and Hyrule Castle are filled with the bosses they need already defeated
+    boss_items = {
+        dungeon_name: get_required_boss_items(world, dungeon_name)
+        for dungeon_name in free
+        if own[dungeon_name] > 0
+    }
+    if not any(boss_items.values()):
+        return
+
+    state = CollectionState(world.multiworld)
+    for item_name in world.progression_pool:
+        state.collect(world.get_logic_item(item_name), True)
+    for item in pre_fill_items:
+        state.collect(world.get_logic_item(item.name), True)
+    state.sweep_for_advancements()
+
+    for dungeon_name, required in boss_items.items():
+        for boss_item in required:
+            if boss_item.location is None or not boss_item.location.can_reach(state):
+                raise FillError(
+                    f"[Twilight Princess] {boss_item.name} can't be reached, {dungeon_name} items can't be placed for player {world.player}"
+                )
@@ -1,6 +1,14 @@
-from typing import TYPE_CHECKING, Dict, List, Tuple
-
-from BaseClasses import ItemClassification as IC, LocationProgressType
+from collections import Counter
+from itertools import accumulate
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple
+
+from BaseClasses import (
+    CollectionState,
+    Item,
+    ItemClassification as IC,
+    Location,
+    LocationProgressType,
+)
 from Fill import FillError
 from ..Logic.Macros import *
 from ...generic.Rules import set_rule
@@ -14,7 +22,15 @@ from ..options import (
     SkyCharactersShuffled,
 )
 
-from ..Items import ITEM_TABLE, TPItem, TPItemData, item_factory, item_name_groups
+from ..Items import (
+    ITEM_TABLE,
+    TP_ITEM_INDEX,
+    TPItem,
+    TPItemData,
+    item_factory,
+    item_name_groups,
+)
+from .Cache import cache_by
 
 if TYPE_CHECKING:
     from .. import TPWorld
@@ -144,6 +160,25 @@ VANILLA_BIG_KEY_LOCATIONS = {
         ],
     },
 }
+
+# The boss of each dungeon, its "<boss> Defeated" event is locked on the "<dungeon> <boss>" location.
+# Not to be confused with DUNGEON_TO_BOSS_DEFEAT, the locations of the rewards for defeating it.
+DUNGEON_TO_BOSS_NAME: Dict[str, str] = {
+    "Forest Temple": "Diababa",
+    "Goron Mines": "Fyrus",
+    "Lakebed Temple": "Morpheel",
+    "Arbiters Grounds": "Stallord",
+    "Snowpeak Ruins": "Blizzeta",
+    "Temple of Time": "Armogohma",
+    "City in The Sky": "Argorok",
+    "Palace of Twilight": "Zant",
+}
+# The logic counts the defeat events, rules checking an event missing from the index would not be compiled
+assert {
+    f"{boss} Defeated" for boss in DUNGEON_TO_BOSS_NAME.values()
+} <= TP_ITEM_INDEX.keys(), "[Twilight Princess] Boss defeated events missing from LOGIC_ONLY_ITEMS"
+
+# The locations of the heart container and dungeon reward each dungeon's boss gives
 DUNGEON_TO_BOSS_DEFEAT: dict[str, list[str | None]] = {
     "Forest Temple": [
         "Forest Temple Diababa Heart Container",
@@ -358,6 +393,179 @@ VANILLA_SKY_CHARACTER_LOCATIONS = [
 ]
 
 
+class PrefillPool:
+    """
+    The pre fill items indexed by name.
+
+    Items are taken out by name without scanning the rest of the pool.
+    Items with the same name keep the order they were added in.
+    """
+
+    def __init__(self, items: Iterable[Item]):
+        self._items: Dict[str, List[Item]] = {}
+        for item in items:
+            self._items.setdefault(item.name, []).append(item)
+        self._size = sum(len(named_items) for named_items in self._items.values())
+        # Every name the pool started with, for checking an item was meant to be pre filled
+        self.names: frozenset = frozenset(self._items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_name: str) -> bool:
+        return item_name in self._items
+
+    def __iter__(self) -> Iterator[Item]:
+        for named_items in self._items.values():
+            yield from named_items
+
+    def __repr__(self) -> str:
+        return f"PrefillPool({list(self)})"
+
+    def count(self, item_name: str) -> int:
+        return len(self._items.get(item_name, ()))
+
+    def take(self, item_name: str) -> List[Item]:
+        """Remove and return every item with the name, an empty list if there are none left."""
+        named_items = self._items.pop(item_name, [])
+        self._size -= len(named_items)
+        return named_items
+
+
+class PrefillStates:
+    """
+    Collection states for the pre fill built in layers on top of one shared base state.
+
+    A layer only records the items it has on top of the base until it is needed.
+    Then it is copied from the base, the items are collected without sweeping,
+    and it is swept once starting from what the base already swept.
+    """
+
+    def __init__(self, base: CollectionState, player: int):
+        self.base = base
+        self.player = player
+        self._items: Dict[str, List[Item]] = {}
+        self._counts: Dict[str, Counter] = {}
+        self._states: Dict[str, CollectionState] = {}
+
+    def add(self, layer: str, item: Item) -> None:
+        assert (
+            layer not in self._states
+        ), f"[Twilight Princess] {layer=} already built, {item=} would be missing"
+        self._items.setdefault(layer, []).append(item)
+        self._counts.setdefault(layer, Counter())[item.name] += 1
+
+    def count(self, layer: str, item_name: str) -> int:
+        """Count an item in a layer without building the layer, items found by sweeping are not counted."""
+        if layer in self._states:
+            return self._states[layer].count(item_name, self.player)
+        return self.base.count(item_name, self.player) + self._counts.get(
+            layer, Counter()
+        )[item_name]
+
+    def get(self, layer: str) -> CollectionState:
+        """Get the state of a layer, the same state is returned every time."""
+        if layer not in self._states:
+            state = self.base.copy()
+            for item in self._items.get(layer, ()):
+                state.collect(item, True)
+            if layer in self._items:
+                state.sweep_for_advancements()
+            self._states[layer] = state
+        return self._states[layer]
+
+
+@cache_by(lambda world: world.option_profile)
+def _get_sphere_one_names(world: "TPWorld") -> Tuple[str, ...]:
+    """Get the names of the locations that can be reached with no items, only depends on the option profile."""
+    assert world.option_profile is not None, "[Twilight Princess] No option profile"
+    state = CollectionState(world.multiworld)
+    for item in world.multiworld.precollected_items[world.player]:
+        state.remove(item)
+    return tuple(
+        location.name
+        for location in world.multiworld.get_locations(world.player)
+        if isinstance(location.address, int) and location.can_reach(state)
+    )
+
+
+def get_sphere_one_locations(world: "TPWorld") -> List[Location]:
+    """Get the locations of the world that can be reached with no items, in LOCATION_TABLE order."""
+    return [world.get_location(name) for name in _get_sphere_one_names(world)]
+
+
+def get_early_crystal_locations(
+    world: "TPWorld", state: CollectionState, shadow_crystal: Item
+) -> List[Location]:
+    """
+    Get the locations the early Shadow Crystal can go in.
+
+    Locations reachable with no items are tried first, then everything the state can reach.
+    Excluded locations are only used when there is nowhere else, like fill_restrictive with allow_excluded.
+
+    :param world: The world to place the Shadow Crystal in.
+    :param state: A state that has collected and swept everything the world starts with.
+    :param shadow_crystal: The Shadow Crystal to place.
+    :return: The empty locations it can go in.
+    """
+    locations = [
+        location
+        for location in get_sphere_one_locations(world)
+        if location.item is None
+        and location.can_fill(state, shadow_crystal, False)
+    ]
+    if locations:
+        return locations
+
+    reachable = [
+        location
+        for location in world.multiworld.get_locations(world.player)
+        if isinstance(location.address, int)
+        and location.item is None
+        and location.can_reach(state)
+    ]
+    return [
+        location
+        for location in reachable
+        if location.can_fill(state, shadow_crystal, False)
+    ] or [location for location in reachable if location.item_rule(shadow_crystal)]
+
+
+# Use the same weights for filler items used in the base randomizer, Ice Traps use the trap frequency.
+FILLER_CONSUMABLES: Dict[str, int] = {
+    # "Green Rupee": 1,
+    # "Blue Rupee": 2,
+    # "Yellow Rupee": 3,
+    # "Red Rupee": 1,
+    "Purple Rupee": 2,
+    "Orange Rupee": 3,
+    "Silver Rupee": 2,
+    # "Arrows (10)": 1,
+    # "Arrows (20)": 2,
+    "Arrows (30)": 1,
+    "Seeds (50)": 1,
+    # "Bombs (5)": 1,
+    # "Bombs (10)": 2,
+    # "Bombs (20)": 2,
+    "Bombs (30)": 1,
+    # "Bomblings (3)": 1,
+    # "Bomblings (5)": 2,
+    "Bomblings (10)": 1,
+    # "Water Bombs (3)": 1,
+    # "Water Bombs (5)": 2,
+    "Water Bombs (10)": 1,
+}
+
+@cache_by(lambda world: world.options.trap_frequency.value)
+def get_filler_table(world: "TPWorld") -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """Get the consumable filler item names and their cumulative weights for random.choices."""
+    names = (*FILLER_CONSUMABLES, "Ice Trap")
+    cum_weights = tuple(
+        accumulate([*FILLER_CONSUMABLES.values(), world.options.trap_frequency.value])
+    )
+    return names, cum_weights
+
+
 def generate_itempool(world: "TPWorld") -> None:
     multiworld = world.multiworld
 
@@ -372,6 +580,101 @@ def generate_itempool(world: "TPWorld") -> None:
     multiworld.itempool.extend(items)
 
 
+def _classification_category(classification: IC) -> str:
+    if classification & IC.progression:
+        return "progression"
+    elif classification & IC.useful:
+        return "useful"
+    return "filler"
+
+
+def _get_pool_key(world: "TPWorld") -> tuple:
+    options = world.options
+    return (
+        options.small_key_settings.value,
+        options.big_key_settings.value,
+        options.map_and_compass_settings.value,
+        options.golden_bugs_shuffled.value,
+        options.poe_shuffled.value,
+        options.sky_characters_shuffled.value,
+        options.early_shadow_crystal.value,
+    )
+
+
+@cache_by(_get_pool_key)
+def get_pool_categories(world: "TPWorld") -> Tuple[Tuple[str, str], ...]:
+    """Get the pool (prefill, precollected, progression, useful or filler) of each ITEM_TABLE item, before determine_item_classification."""
+    options = world.options
+    categories: List[Tuple[str, str]] = []
+    for item, data in ITEM_TABLE.items():
+        # Catch items that need special handling
+        if data.code is None or item in ["Victory", "Ice Trap"]:
+            assert item in ["Victory", "Ice Trap"], f"[Twilight Princess] {item}"
+            continue
+
+        # Prefill check
+        if (
+            (
+                item in item_name_groups["Small Keys"]
+                and options.small_key_settings.in_dungeon
+            )
+            or (
+                item in item_name_groups["Big Keys"]
+                and options.big_key_settings.in_dungeon
+            )
+            or (
+                item in item_name_groups["Maps and Compasses"]
+                and options.map_and_compass_settings.in_dungeon
+            )
+            or (
+                item in item_name_groups["Bugs"]
+                and options.golden_bugs_shuffled.value
+                == GoldenBugsShuffled.option_false
+            )
+            or (
+                item == "Poe Soul"
+                and options.poe_shuffled.value == PoeShuffled.option_false
+            )
+            or (
+                item == "Shadow Crystal"
+                and options.early_shadow_crystal == EarlyShadowCrystal.option_true
+            )
+            or (
+                item == "Progressive Sky Book"
+                and options.sky_characters_shuffled.value
+                == SkyCharactersShuffled.option_false
+            )
+        ):
+            categories.append((item, "prefill"))
+
+        # Start-with items
+        elif (
+            (
+                item in item_name_groups["Small Keys"]
+                and options.small_key_settings.value == DungeonItem.option_startwith
+            )
+            or (
+                item in ["Gate Keys", "Gerudo Desert Bublin Camp Key"]
+                and options.small_key_settings.value == DungeonItem.option_startwith
+            )
+            or (
+                item in item_name_groups["Big Keys"]
+                and options.big_key_settings.value == DungeonItem.option_startwith
+            )
+            or (
+                item in item_name_groups["Maps and Compasses"]
+                and options.map_and_compass_settings.value
+                == DungeonItem.option_startwith
+            )
+        ):
+            categories.append((item, "precollected"))
+
+        else:
+            categories.append((item, _classification_category(data.classification)))
+
+    return tuple(categories)
+
+
 def get_pool_core(world: "TPWorld") -> Tuple[List[str], List[str]]:
     pool: List[str] = []
     precollected_items: List[str] = []
@@ -383,107 +686,34 @@ def get_pool_core(world: "TPWorld") -> Tuple[List[str], List[str]]:
     useful_pool: list[str] = []
     filler_pool: list[str] = []
 
-    for item, data in ITEM_TABLE.items():
-        # Catch items that need special handling
-        if data.code != None and item not in ["Victory", "Ice Trap"]:
-            # Prefill check
-            if (
-                (
-                    item in item_name_groups["Small Keys"]
-                    and world.options.small_key_settings.in_dungeon
-                )
-                or (
-                    item in item_name_groups["Big Keys"]
-                    and world.options.big_key_settings.in_dungeon
-                )
-                or (
-                    item in item_name_groups["Maps and Compasses"]
-                    and world.options.map_and_compass_settings.in_dungeon
-                )
-                or (
-                    item in item_name_groups["Bugs"]
-                    and world.options.golden_bugs_shuffled.value
-                    == GoldenBugsShuffled.option_false
-                )
-                or (
-                    item == "Poe Soul"
-                    and world.options.poe_shuffled.value == PoeShuffled.option_false
-                )
-                or (
-                    item == "Shadow Crystal"
-                    and world.options.early_shadow_crystal
-                    == EarlyShadowCrystal.option_true
-                )
-                or (
-                    item == "Progressive Sky Book"
-                    and world.options.sky_characters_shuffled.value
-                    == SkyCharactersShuffled.option_false
-                )
-            ):
-                prefill_pool.extend([item] * data.quantity)
-                continue
-
-            # Start-with items
-            if (
-                (
-                    item in item_name_groups["Small Keys"]
-                    and world.options.small_key_settings.value
-                    == DungeonItem.option_startwith
-                )
-                or (
-                    item in ["Gate Keys", "Gerudo Desert Bublin Camp Key"]
-                    and world.options.small_key_settings.value
-                    == DungeonItem.option_startwith
-                )
-                or (
-                    item in item_name_groups["Big Keys"]
-                    and world.options.big_key_settings.value
-                    == DungeonItem.option_startwith
-                )
-                or (
-                    item in item_name_groups["Maps and Compasses"]
-                    and world.options.map_and_compass_settings.value
-                    == DungeonItem.option_startwith
-                )
-            ):
-                precollected_items.extend([item] * data.quantity)
-                continue
-
+    pools = {
+        "prefill": prefill_pool,
+        "precollected": precollected_items,
+        "progression": progression_pool,
+        "useful": useful_pool,
+        "filler": filler_pool,
+    }
+    for item, category in get_pool_categories(world):
+        if category not in ("prefill", "precollected"):
             # Other items get shuffled normally so sort by classification into pools
-            adjusted_classification = world.determine_item_classification(item)
-            classification = (
-                data.classification
-                if adjusted_classification is None
-                else adjusted_classification
-            )
-
-            if classification & IC.progression:
-                progression_pool.extend([item] * data.quantity)
-            elif classification & IC.useful:
-                useful_pool.extend([item] * data.quantity)
-            else:
-                filler_pool.extend([item] * data.quantity)
-
-        else:
-            assert item in ["Victory", "Ice Trap"], f"[Twilight Princess] {item}"
-
-    # Get the number of locations that have not been filled yet
-    placeable_locations = [
-        location
-        for location in world.multiworld.get_locations(world.player)
-        if location.address is not None and location.item is None
-    ]
-
-    num_items_left_to_place = len(placeable_locations) - len(prefill_pool)
+            adjusted_classification = world.get_item_classification(item)
+            if adjusted_classification is not None:
+                category = _classification_category(adjusted_classification)
+        pools[category].extend([item] * ITEM_TABLE[item].quantity)
+
+    # Count the locations that have not been filled yet, and the ones of those that can hold progression items
+    placeable_locations = 0
+    progression_locations = 0
+    for location in world.multiworld.get_locations(world.player):
+        if location.address is not None and location.item is None:
+            placeable_locations += 1
+            if location.progress_type != LocationProgressType.EXCLUDED:
+                progression_locations += 1
+
+    num_items_left_to_place = placeable_locations - len(prefill_pool)
 
     # Check progression pool against locations that can hold progression items
-    if len(progression_pool) > len(
-        [
-            location
-            for location in placeable_locations
-            if location.progress_type != LocationProgressType.EXCLUDED
-        ]
-    ):
+    if len(progression_pool) > progression_locations:
         raise FillError(
             "[Twilight Princess] There are insufficient locations to place progression items! "
             f"Trying to place {len(progression_pool)} items in only {num_items_left_to_place} locations."
@@ -510,151 +740,54 @@ def get_pool_core(world: "TPWorld") -> Tuple[List[str], List[str]]:
     assert len(world.filler_pool) > 0, f"[Twilight Princess] {len(world.filler_pool)=}"
 
     # Place filler items ensure that the pool has the correct number of items.
-    pool.extend([world.get_filler_item_name() for _ in range(num_items_left_to_place)])
+    pool.extend(world.get_filler_item_names(num_items_left_to_place))
 
     return pool, precollected_items
 
 
 # TODO Check varible classification of boss items
-# Used to fill out boss defeat events and result used to fill out prefill Collection State
-def get_boss_defeat_items(world: "TPWorld"):
-    return {
-        "Diababa": TPItem(
-            "Diababa Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    # if world.options.castle_requirements.value
-                    # == CastleRequirements.option_all_dungeons
-                    # else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Fyrus": TPItem(
-            "Fyrus Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    # if world.options.castle_requirements.value
-                    # == CastleRequirements.option_all_dungeons
-                    # else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Morpheel": TPItem(
-            "Morpheel Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    if world.options.castle_requirements.value
-                    == CastleRequirements.option_all_dungeons
-                    else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Stallord": TPItem(
-            "Stallord Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    if world.options.castle_requirements.value
-                    in [
-                        CastleRequirements.option_all_dungeons,
-                        CastleRequirements.option_vanilla,
-                    ]
-                    else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Blizzeta": TPItem(
-            "Blizzeta Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    # if world.options.castle_requirements.value
-                    # == CastleRequirements.option_all_dungeons
-                    # else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Armogohma": TPItem(
-            "Armogohma Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    # if world.options.castle_requirements.value
-                    # == CastleRequirements.option_all_dungeons
-                    # else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Argorok": TPItem(
-            "Argorok Defeated",
-            world.player,
-            TPItemData(
-                code=None,
-                type="Boss Defeated",
-                quantity=1,
-                classification=(
-                    IC.progression
-                    if world.options.castle_requirements.value
-                    == CastleRequirements.option_all_dungeons
-                    or world.options.palace_requirements
-                    == PalaceRequirements.option_vanilla
-                    else IC.useful
-                ),
-                item_id=1,
-            ),
-        ),
-        "Zant": TPItem(
-            "Zant Defeated",
-            world.player,
+@cache_by(
+    lambda world: (
+        world.options.castle_requirements.value,
+        world.options.palace_requirements.value,
+    )
+)
+def get_boss_defeat_data(world: "TPWorld") -> Tuple[Tuple[str, TPItemData], ...]:
+    """Get each boss and its defeat event data, in DUNGEON_TO_BOSS_NAME order, for the castle and palace requirements."""
+    castle_requirements = world.options.castle_requirements.value
+    palace_requirements = world.options.palace_requirements.value
+
+    # Bosses that are not needed for the castle or palace are only useful
+    progression_bosses = {"Diababa", "Fyrus", "Blizzeta", "Armogohma"}
+    if castle_requirements == CastleRequirements.option_all_dungeons:
+        progression_bosses.update(DUNGEON_TO_BOSS_NAME.values())
+    elif castle_requirements == CastleRequirements.option_vanilla:
+        progression_bosses.update(["Stallord", "Zant"])
+    if palace_requirements == PalaceRequirements.option_vanilla:
+        progression_bosses.add("Argorok")
+
+    return tuple(
+        (
+            boss,
             TPItemData(
                 code=None,
                 type="Boss Defeated",
                 quantity=1,
                 classification=(
-                    IC.progression
-                    if world.options.castle_requirements.value
-                    in [
-                        CastleRequirements.option_all_dungeons,
-                        CastleRequirements.option_vanilla,
-                    ]
-                    else IC.useful
+                    IC.progression if boss in progression_bosses else IC.useful
                 ),
                 item_id=1,
             ),
-        ),
+        )
+        for boss in DUNGEON_TO_BOSS_NAME.values()
+    )
+
+
+# Used to fill out boss defeat events and result used to fill out prefill Collection State
+def get_boss_defeat_items(world: "TPWorld") -> Dict[str, TPItem]:
+    return {
+        boss: TPItem(f"{boss} Defeated", world.player, data)
+        for boss, data in get_boss_defeat_data(world)
     }
 
 
@@ -0,0 +1,258 @@
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from BaseClasses import Item, LocationProgressType
+from ..Items import TP_ITEM_INDEX, item_name_groups
+from ..Locations import LOCATION_TABLE, TPFlag
+from .ItemPool import (
+    VANILLA_GOLDEN_BUG_LOCATIONS,
+    VANILLA_POE_LOCATIONS,
+    VANILLA_SKY_CHARACTER_LOCATIONS,
+)
+
+if TYPE_CHECKING:
+    from .. import TPWorld
+
+
+class PostFillInvariant(NamedTuple):
+    """
+    Something that has to be true for a group of locations once the fill is done.
+
+    :param reason: Why it has to be true, used in the error message.
+    :param applies: If the invariant applies to the world, usually an option check.
+    :param flags: The locations to check have all of these flags.
+    :param without: The locations to check have none of these flags.
+    :param exact: The locations to check have exactly the flags, nothing else.
+    :param name_filter: The locations to check also need a name this accepts.
+    :param progress_type: The progress type the locations must have.
+    :param items: The only items the locations can have.
+    :param forbidden_items: The items the locations can't have.
+    :param vanilla_locations: Every location checked must be one of these.
+    """
+
+    reason: str
+    applies: Callable[["TPWorld"], bool]
+    flags: Optional[TPFlag] = None
+    without: Optional[TPFlag] = None
+    exact: bool = False
+    name_filter: Optional[Callable[[str], bool]] = None
+    progress_type: Optional[LocationProgressType] = None
+    items: Optional[FrozenSet[str]] = None
+    forbidden_items: FrozenSet[str] = frozenset()
+    vanilla_locations: Optional[FrozenSet[str]] = None
+
+
+# Story locations keep their vanilla items
+STORY_ITEMS: Dict[str, str] = {
+    "Renados Letter": "Renado's Letter",
+    "Telma Invoice": "Invoice",
+    "Wooden Statue": "Wooden Statue",
+    "Ilias Charm": "Ilias Charm",
+    "Ilia Memory Reward": "Horse Call",
+}
+# place_deterministic_items places these as events, the logic can only count them if they are in the index
+assert (
+    set(STORY_ITEMS.values()) <= TP_ITEM_INDEX.keys()
+), "[Twilight Princess] Story items missing from LOGIC_ONLY_ITEMS"
+
+# As part of (semi-)tiger beetle style test ensure things worked Properly in prod
+# This Allows for easy fuzzing to test find bugs
+POST_FILL_INVARIANTS: Tuple[PostFillInvariant, ...] = (
+    # Poe (Vanilla when not Shuffled) (ignore Jovani), catches Dungeon Poes as well
+    PostFillInvariant(
+        "poes not shuffled",
+        lambda world: not world.options.poe_shuffled,
+        flags=TPFlag.Poe,
+        without=TPFlag.Npc,
+        items=frozenset(["Poe Soul"]),
+        vanilla_locations=frozenset(VANILLA_POE_LOCATIONS),
+    ),
+    # Bugs (Vanilla when not Shuffled) (ignore agitha)
+    PostFillInvariant(
+        "bugs not shuffled",
+        lambda world: not world.options.golden_bugs_shuffled,
+        flags=TPFlag.Bug,
+        without=TPFlag.Npc,
+        items=frozenset(item_name_groups["Bugs"]),
+        vanilla_locations=frozenset(VANILLA_GOLDEN_BUG_LOCATIONS.values()),
+    ),
+    # Hidden Skill (Excluded when not Shuffled)
+    PostFillInvariant(
+        "hidden_skill not shuffled",
+        lambda world: not world.options.hidden_skills_shuffled,
+        flags=TPFlag.Skill,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # Sky Book (Vanilla when not Shuffled)
+    PostFillInvariant(
+        "Sky Characters not shuffled",
+        lambda world: not world.options.sky_characters_shuffled,
+        flags=TPFlag.Sky_Book,
+        name_filter=lambda name: "Sky Character" not in name,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    PostFillInvariant(
+        "Sky Characters not shuffled",
+        lambda world: not world.options.sky_characters_shuffled,
+        flags=TPFlag.Sky_Book,
+        name_filter=lambda name: "Sky Character" in name,
+        items=frozenset(["Progressive Sky Book"]),
+        vanilla_locations=frozenset(VANILLA_SKY_CHARACTER_LOCATIONS),
+    ),
+    # Heart (Excluded when not Shuffled) (Do not Consider Boss heart containers)
+    PostFillInvariant(
+        "Heart Pieces not shuffled",
+        lambda world: not world.options.heart_piece_shuffled,
+        flags=TPFlag.Heart,
+        without=TPFlag.Boss,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # Shop (Excluded when not Shuffled)
+    PostFillInvariant(
+        "Shop not shuffled",
+        lambda world: not world.options.shop_items_shuffled,
+        flags=TPFlag.Shop,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # NPC (Excluded when not Shuffled), Agitha and Jovani included
+    PostFillInvariant(
+        "NPC's not shuffled",
+        lambda world: not world.options.npc_items_shuffled,
+        flags=TPFlag.Npc,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # Story (Vanilla items, no other locations should have the items)
+    *(
+        PostFillInvariant(
+            "it is a story location",
+            lambda world: True,
+            name_filter=lambda name, _location=location: name == _location,
+            items=frozenset([item]),
+        )
+        for location, item in STORY_ITEMS.items()
+    ),
+    # Dungeon (Check Only Dungeon Locations)
+    PostFillInvariant(
+        "Dungeons not shuffled",
+        lambda world: not world.options.dungeons_shuffled,
+        flags=TPFlag.Dungeon,
+        exact=True,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # Boss / Mini Boss, Dungeon Rewards (Becomes Priority)
+    PostFillInvariant(
+        "Dungeons rewards are progression",
+        lambda world: bool(world.options.dungeon_rewards_progression),
+        flags=TPFlag.Boss,
+        progress_type=LocationProgressType.PRIORITY,
+    ),
+    # (Default check of dungeon)
+    PostFillInvariant(
+        "Dungeons not shuffled",
+        lambda world: not world.options.dungeon_rewards_progression
+        and not world.options.dungeons_shuffled,
+        flags=TPFlag.Boss,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # Small Keys On Bosses (Check Item)
+    PostFillInvariant(
+        "small keys are not on bosses",
+        lambda world: not world.options.small_keys_on_bosses,
+        flags=TPFlag.Boss,
+        forbidden_items=frozenset(item_name_groups["Small Keys"]),
+    ),
+    # Small Key
+    # Big Key
+    # M&C
+    # Overworld (Check only overworld flagged locations)
+    PostFillInvariant(
+        "OverWorld not shuffled",
+        lambda world: not world.options.overworld_shuffled,
+        flags=TPFlag.Overworld,
+        exact=True,
+        progress_type=LocationProgressType.EXCLUDED,
+    ),
+    # Early Shadow Crystal
+)
+
+
+def get_invariant_locations(invariant: PostFillInvariant) -> FrozenSet[str]:
+    """Get the names of the locations an invariant checks."""
+    names = []
+    for location_name, data in LOCATION_TABLE.items():
+        if invariant.flags is not None:
+            if invariant.exact:
+                if data.flags != invariant.flags:
+                    continue
+            elif (data.flags & invariant.flags) != invariant.flags:
+                continue
+        if invariant.without is not None and data.flags & invariant.without:
+            continue
+        if invariant.name_filter is not None and not invariant.name_filter(
+            location_name
+        ):
+            continue
+        names.append(location_name)
+    return frozenset(names)
+
+
+# Every invariant with the locations it checks, they only depend on LOCATION_TABLE
+POST_FILL_CHECKS: Tuple[Tuple[PostFillInvariant, FrozenSet[str]], ...] = tuple(
+    (invariant, get_invariant_locations(invariant))
+    for invariant in POST_FILL_INVARIANTS
+)
+
+
+def check_post_fill(world: "TPWorld") -> None:
+    """
+    Check every invariant in POST_FILL_INVARIANTS that applies to the world.
+
+    The locations are read once, then each invariant is a few set operations.
+
+    :param world: The world to check, after the fill.
+    :raises AssertionError: When a location breaks an invariant.
+    """
+    item_names: Dict[str, str] = {}
+    progress_types: Dict[LocationProgressType, set] = {
+        progress_type: set() for progress_type in LocationProgressType
+    }
+    for location_name in LOCATION_TABLE:
+        location = world.get_location(location_name)
+        assert isinstance(
+            location.item, Item
+        ), f"[Twilight Princess] (Post Fill Error) {location_name} has no item"
+        item_names[location_name] = location.item.name
+        progress_types[location.progress_type].add(location_name)
+
+    for invariant, locations in POST_FILL_CHECKS:
+        if not invariant.applies(world):
+            continue
+
+        if invariant.progress_type is not None:
+            wrong = locations - progress_types[invariant.progress_type]
+            assert (
+                not wrong
+            ), f"[Twilight Princess] (Post Fill Error) {sorted(wrong)} are not {invariant.progress_type} but {invariant.reason}"
+
+        if invariant.items is not None:
+            wrong = {
+                name for name in locations if item_names[name] not in invariant.items
+            }
+            assert (
+                not wrong
+            ), f"[Twilight Princess] (Post Fill Error) {sorted(wrong)} do not have {sorted(invariant.items)} but {invariant.reason}"
+
+        if invariant.forbidden_items:
+            wrong = {
+                name
+                for name in locations
+                if item_names[name] in invariant.forbidden_items
+            }
+            assert (
+                not wrong
+            ), f"[Twilight Princess] (Post Fill Error) {sorted(wrong)} have forbidden items but {invariant.reason}"
+
+        if invariant.vanilla_locations is not None:
+            wrong = locations - invariant.vanilla_locations
+            assert (
+                not wrong
+            ), f"[Twilight Princess] (Post Fill Error) {sorted(wrong)} are not vanilla locations but {invariant.reason}"
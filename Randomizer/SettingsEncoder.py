@@ -20,6 +20,7 @@ def get_item_placements(
 
     location_number_to_item_code: dict[int, int] = {}
     loaction_to_item = []
+    addressable_locations = 0
 
     for location in multiworld.get_locations(player):
         assert isinstance(location, TPLocation)
@@ -30,6 +31,7 @@ def get_item_placements(
         # Ignore event locations
         if not isinstance(location.code, int):
             continue
+        addressable_locations += 1
 
         # If item is local then encode it as
         if location.item.player == player:
@@ -41,14 +43,9 @@ def get_item_placements(
             location_number_to_item_code[location.code] = FILLER_ITEM_CODE
 
     # All locations that ap tracks are given a number and an item (ignore Story locations, Logic Event locations)
-    assert len(location_number_to_item_code) == len(
-        [
-            location
-            for location in multiworld.get_locations(player)
-            # Filer
-            if isinstance(location.address, int)
-        ]
-    ), f"[Twilight Princess] {len(location_number_to_item_code)},{len(multiworld.get_locations(player))}"
+    assert (
+        len(location_number_to_item_code) == addressable_locations
+    ), f"[Twilight Princess] {len(location_number_to_item_code)},{addressable_locations}"
 
     result = encode_item_placements(location_number_to_item_code)
     assert isinstance(result, str)
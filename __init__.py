@@ -1,16 +1,18 @@
+from collections import Counter
 from collections.abc import Mapping
-from copy import deepcopy
 import json
+import logging
 import os
 from typing import Any, ClassVar, Optional
 
-from Fill import fill_restrictive
+from Fill import FillError
 from BaseClasses import CollectionState, Item, LocationProgressType
 from BaseClasses import ItemClassification as IC
 from BaseClasses import Tutorial
 from .ClientUtils import VERSION
 from .Items import (
     ITEM_TABLE,
+    TP_ITEM_INDEX,
     TPItem,
     item_factory,
     item_name_groups,
@@ -18,9 +20,10 @@ from .Items import (
 from Options import OptionError, Toggle
 from .Locations import (
     LOCATION_TABLE,
-    LOCATION_TO_REGION,
+    STAGE_TO_LOCATIONS,
     TPFlag,
     TPLocation,
+    TPStages,
 )
 from .options import *
 from worlds.AutoWorld import WebWorld, World
@@ -32,26 +35,39 @@ from worlds.LauncherComponents import (
     launch_subprocess,
 )
 
+from .Randomizer.DungeonFill import (
+    check_prefill_feasibility,
+    get_own_dungeon_exceptions,
+    get_required_boss_items,
+    place_dungeon_items,
+)
+from .Randomizer.PostFill import check_post_fill
 from .Randomizer.SettingsEncoder import get_item_placements, get_setting_string
 from .Randomizer.ItemPool import (
     DUNGEON_TO_BOSS_DEFEAT,
     VANILLA_GOLDEN_BUG_LOCATIONS,
     VANILLA_POE_LOCATIONS,
     VANILLA_SKY_CHARACTER_LOCATIONS,
+    PrefillPool,
+    PrefillStates,
     generate_itempool,
     get_boss_defeat_items,
+    get_filler_table,
+    get_early_crystal_locations,
     place_deterministic_items,
     VANILLA_SMALL_KEYS_LOCATIONS,
     VANILLA_BIG_KEY_LOCATIONS,
     VANILLA_MAP_AND_COMPASS_LOCATIONS,
 )
 
-from .Logic.Rules import set_location_access_rules
-from .Logic.RegionConnection import connect_regions
-from .Logic.RegionCreation import (
-    create_regions,
+from .Logic.Rules import (
+    TPOptionProfile,
+    get_option_profile,
+    set_location_access_rules,
 )
+from .Logic.GraphTemplate import create_world_graph, get_graph_template
 from .Logic.RegionRules import set_region_access_rules
+from .Logic.RuleDependencies import register_indirect_conditions
 
 
 def run_client() -> None:
@@ -101,8 +117,8 @@ class TPWorld(World):
     Join Link and Midna on their adventure through Hyrule in Twilight Princess.
     """
 
-    # Currently using can reach region to check for access rules. may update later
-    explicit_indirect_conditions = False
+    # Rules that check can reach region have their regions registered as indirect conditions in set_rules
+    explicit_indirect_conditions = True
 
     options_dataclass = TPOptions
     options: TPOptions
@@ -145,6 +161,23 @@ class TPWorld(World):
 
         self.invalid_locations: list[str] = []
 
+        # Filled lazily by get_item_classification and get_logic_item
+        self.item_classifications: dict[str, Optional[IC]] = {}
+        self.logic_items: dict[str, TPItem] = {}
+
+        # Filled lazily by get_stage_locations
+        self.stage_locations: dict[TPStages, tuple[TPLocation, ...]] = {}
+
+        # Filled in by the rule compiler, bit masks of the compiled rules that check each item in TP_ITEM_INDEX
+        self.item_rule_masks: list[int] = [0] * len(TP_ITEM_INDEX)
+        self.compiled_rule_count = 0
+
+        # Basic cost metrics of the logic for the chosen options, filled in set_rules
+        self.logic_stats: Counter[str] = Counter()
+
+        # Set at the end of generate_early once the options are final
+        self.option_profile: Optional[TPOptionProfile] = None
+
     def _determine_nonprogress_and_progress_locations(
         self,
     ) -> tuple[set[str], set[str]]:
@@ -262,6 +295,8 @@ class TPWorld(World):
             self.multiworld.local_early_items[self.player]["Gale Boomerang"] = 1
             self.multiworld.local_early_items[self.player]["Lantern"] = 1
 
+        self.option_profile = get_option_profile(self)
+
     def create_regions(self) -> None:
         """
         Create and connect regions for the Twilight Princess world.
@@ -270,11 +305,8 @@ class TPWorld(World):
         Then it connects the regions to each other.
         """
 
-        # This adds all the regions. (build vertices)
-        create_regions(self.multiworld, self.player)
-
-        # This connects all the regions to each other. (build edges)
-        connect_regions(self.multiworld, self.player)
+        # This adds all the regions and connects them to each other. (build vertices and edges)
+        regions = create_world_graph(self)
 
         menu = self.get_region(self.origin_region_name)
         menu.connect(self.get_region("Outside Links House"))
@@ -322,22 +354,17 @@ class TPWorld(World):
             ), f"[Twilight Princess] Something Terrible went wrong with the location categorizing {len(self.progress_locations)=} + {len(self.nonprogress_locations)} != {len(LOCATION_TABLE)=}"
 
         # Place locations in their locations
-        for location_name, data in LOCATION_TABLE.items():
+        dungeon_rewards_progression = (
+            self.options.dungeon_rewards_progression.value
+            == DungeonRewardsProgression.option_true
+        )
+        for region_index, location_name, data in get_graph_template().locations:
             assert (
                 location_name in self.progress_locations
                 or location_name in self.nonprogress_locations
             ), f"[Twilight Princess] {location_name=} is not in non/progress_locations"
-            assert (
-                location_name in LOCATION_TO_REGION
-            ), f"[Twilight Princess] {location_name=} is not in location to region table"
 
-            region_name = LOCATION_TO_REGION[location_name]
-
-            assert (
-                region_name in self.multiworld.regions.region_cache[self.player]
-            ), f"[Twilight Princess] {region_name=} is not in multiworld regions"
-
-            region = self.multiworld.get_region(region_name, self.player)
+            region = regions[region_index]
             location = TPLocation(
                 self.player,
                 location_name,
@@ -347,25 +374,27 @@ class TPWorld(World):
 
             region.locations.append(location)
             if location_name in self.nonprogress_locations:
-                self.get_location(location_name).progress_type = (
-                    LocationProgressType.EXCLUDED
-                )
-
-        # If dungeon rewards are progression then take a second pass to update Progress Type
-        if (
-            self.options.dungeon_rewards_progression.value
-            == DungeonRewardsProgression.option_true
-        ):
-            for location, data in LOCATION_TABLE.items():
-                if (
-                    (TPFlag.Boss & data.flags)
-                    == TPFlag.Boss
-                    # ) or (
-                    # (TPFlag.MiniBoss & data.flags) == TPFlag.MiniBoss # Might want to make miniboss aswell
-                ):
-                    self.get_location(location).progress_type = (
-                        LocationProgressType.PRIORITY
-                    )  # This happens after location building so it will override dungeons shuffled option
+                location.progress_type = LocationProgressType.EXCLUDED
+
+            # If dungeon rewards are progression then update Progress Type
+            if dungeon_rewards_progression and (
+                (TPFlag.Boss & data.flags)
+                == TPFlag.Boss
+                # ) or (
+                # (TPFlag.MiniBoss & data.flags) == TPFlag.MiniBoss # Might want to make miniboss aswell
+            ):
+                location.progress_type = (
+                    LocationProgressType.PRIORITY
+                )  # This overrides the exclusion from the dungeons shuffled option
+
+    def get_stage_locations(self, stage: TPStages) -> tuple[TPLocation, ...]:
+        """Get every location of the world in a stage, in LOCATION_TABLE order."""
+        if stage not in self.stage_locations:
+            self.stage_locations[stage] = tuple(
+                self.get_location(location_name)
+                for location_name, _ in STAGE_TO_LOCATIONS[stage]
+            )
+        return self.stage_locations[stage]
 
     def create_items(self) -> None:
         """
@@ -387,7 +416,13 @@ class TPWorld(World):
         set_region_access_rules(self, self.player)
         set_location_access_rules(self)
 
-        # Set item rules
+        register_indirect_conditions(self)
+        logging.debug(
+            f"[Twilight Princess] Player {self.player} logic: {dict(self.logic_stats)}"
+        )
+
+        # Set item rules, every location gets one rule checking the names it can't have
+        forbidden_items: dict[str, set[str]] = {}
 
         # Early shadow crystal item rules
         if self.options.early_shadow_crystal.value == EarlyShadowCrystal.option_true:
@@ -409,11 +444,8 @@ class TPWorld(World):
                     for dungeon in vanilla:
                         for item in vanilla[dungeon]:
                             for location in vanilla[dungeon][item]:
-                                old_rule = self.get_location(location).item_rule
-                                self.get_location(location).item_rule = (
-                                    lambda item, _oldrule=old_rule: (
-                                        item.name != "Shadow Crystal" and _oldrule(item)
-                                    )
+                                forbidden_items.setdefault(location, set()).add(
+                                    "Shadow Crystal"
                                 )
 
             # Add item rules for bug and poe locations
@@ -422,31 +454,17 @@ class TPWorld(World):
                 == GoldenBugsShuffled.option_false
             ):
                 for location in VANILLA_GOLDEN_BUG_LOCATIONS.values():
-                    old_rule = self.get_location(location).item_rule
-                    self.get_location(location).item_rule = (
-                        lambda item, _oldrule=old_rule: (
-                            item.name != "Shadow Crystal" and _oldrule(item)
-                        )
-                    )
+                    forbidden_items.setdefault(location, set()).add("Shadow Crystal")
             if self.options.poe_shuffled.value == PoeShuffled.option_false:
                 for location in VANILLA_POE_LOCATIONS:
-                    old_rule = self.get_location(location).item_rule
-                    self.get_location(location).item_rule = (
-                        lambda item, _oldrule=old_rule: (
-                            item.name != "Shadow Crystal" and _oldrule(item)
-                        )
-                    )
+                    forbidden_items.setdefault(location, set()).add("Shadow Crystal")
 
         # Small Keys on bosses based on setting
         if self.options.small_keys_on_bosses.value == SmallKeysOnBosses.option_false:
             for location, data in LOCATION_TABLE.items():
                 if (data.flags & TPFlag.Boss) == TPFlag.Boss:
-                    old_rule = self.get_location(location).item_rule
-                    self.get_location(location).item_rule = (
-                        lambda item, _oldrule=old_rule: (
-                            (item.name not in item_name_groups["Small Keys"])
-                            and _oldrule(item)
-                        )
+                    forbidden_items.setdefault(location, set()).update(
+                        item_name_groups["Small Keys"]
                     )
 
         # Boss keys on own defeat locations
@@ -455,27 +473,34 @@ class TPWorld(World):
                 for location in DUNGEON_TO_BOSS_DEFEAT[dungeon]:
                     if not location:
                         continue
-                    old_rule = self.get_location(location).item_rule
-                    self.get_location(location).item_rule = (
-                        lambda item, _oldrule=old_rule, _key=key: (
-                            (item.name != _key) and _oldrule(item)
-                        )
+                    forbidden_items.setdefault(location, set()).add(key)
+
+        for location_name, names in forbidden_items.items():
+            location = self.get_location(location_name)
+            old_rule = location.item_rule
+            if old_rule is type(location).item_rule:
+                # No rule to keep, only the names need checking
+                location.item_rule = lambda item, _forbidden=frozenset(names): (
+                    item.name not in _forbidden
+                )
+            else:
+                location.item_rule = (
+                    lambda item, _oldrule=old_rule, _forbidden=frozenset(names): (
+                        item.name not in _forbidden and _oldrule(item)
                     )
+                )
 
     def pre_fill(self) -> None:
         """
         Apply special fill rules before the fill stage.
         """
 
-        pre_fill_items = self.get_pre_fill_items()
+        pre_fill_items = PrefillPool(self.get_pre_fill_items())
 
         if self.options.early_shadow_crystal == EarlyShadowCrystal.option_true:
-            found_shadow_crystal = False
-            for item in pre_fill_items:
-                if item.name == "Shadow Crystal":
-                    found_shadow_crystal = True
-            assert found_shadow_crystal, f"Shadow crystal no in pre fill pool"
-            del item
+            assert (
+                "Shadow Crystal" in pre_fill_items
+            ), f"Shadow crystal no in pre fill pool"
 
         # Only do pre fill if it is needed
         if len(pre_fill_items) == 0:
@@ -503,7 +528,9 @@ class TPWorld(World):
         # Shuffle Bugs into vanilla spots if not shuffled
         if self.options.golden_bugs_shuffled.value == GoldenBugsShuffled.option_false:
             bug_list = [
-                item for item in pre_fill_items if item.name in item_name_groups["Bugs"]
+                item
+                for bug in item_name_groups["Bugs"]
+                for item in pre_fill_items.take(bug)
             ]
             assert (
                 len(bug_list) == 24
@@ -513,7 +540,7 @@ class TPWorld(World):
             for bug in item_name_groups["Bugs"]:
                 assert (
                     bug in bug_list_str
-                ), f"[Twilight Princess] {bug=} is not in pre_fill_items, {pre_fill_items=}"
+                ), f"[Twilight Princess] {bug=} is not in pre_fill_items, {bug_list_str=}"
             del bug
 
             for bug in bug_list:
@@ -523,12 +550,11 @@ class TPWorld(World):
 
                 vanilla_location_name = VANILLA_GOLDEN_BUG_LOCATIONS[bug.name]
                 self.get_location(vanilla_location_name).place_locked_item(bug)
-                pre_fill_items.remove(bug)
             del bug
 
         # Shuffle Poes into vanilla spots if not shuffled
         if self.options.poe_shuffled.value == PoeShuffled.option_false:
-            poe_list = [item for item in pre_fill_items if item.name == "Poe Soul"]
+            poe_list = pre_fill_items.take("Poe Soul")
             assert (
                 len(poe_list) == 60
             ), f"[Twilight Princess] There is only {len(poe_list)} / 60 poe souls in the pre fill pool"
@@ -539,7 +565,6 @@ class TPWorld(World):
             for i, poe_soul in enumerate(poe_list):
                 location = VANILLA_POE_LOCATIONS[i]
                 self.get_location(location).place_locked_item(poe_soul)
-                pre_fill_items.remove(poe_soul)
             assert (
                 location == "Snowpeak Poe Among Trees"
             ), f"[Twilight Princess] {location=}"
@@ -550,9 +575,7 @@ class TPWorld(World):
             self.options.sky_characters_shuffled.value
             == SkyCharactersShuffled.option_false
         ):
-            character_list = [
-                item for item in pre_fill_items if item.name == "Progressive Sky Book"
-            ]
+            character_list = pre_fill_items.take("Progressive Sky Book")
             assert (
                 len(character_list) == 7
             ), f"[Twilight Princess] There is only {len(character_list)} / 7 sky characters in the pre fill pool"
@@ -564,11 +587,9 @@ class TPWorld(World):
                 # There are only 6 locations for the characters. Idk where the 7th is so just giving the first
                 if i == 6:
                     self.push_precollected(character)
-                    pre_fill_items.remove(character)
                     continue
                 location = VANILLA_SKY_CHARACTER_LOCATIONS[i]
                 self.get_location(location).place_locked_item(character)
-                pre_fill_items.remove(character)
             assert (
                 location == "Lake Hylia Bridge Owl Statue Sky Character"
             ), f"[Twilight Princess] {location=}"
@@ -578,45 +599,39 @@ class TPWorld(World):
         collection_state_base = CollectionState(self.multiworld)
 
         if self.options.early_shadow_crystal == EarlyShadowCrystal.option_true:
-            locations = self.multiworld.get_locations(self.player)
-            locations = [
-                location for location in locations if isinstance(location.address, int)
-            ]
-
-            assert len(locations) > 0, f"[Twilight Princess] {locations=}"
-            self.multiworld.random.shuffle(locations)
             # Add shadow crystal to world
-            shadow_crystal_item_s = [
-                item for item in pre_fill_items if item.name == "Shadow Crystal"
-            ]
+            shadow_crystal_item_s = pre_fill_items.take("Shadow Crystal")
             assert (
                 len(shadow_crystal_item_s) == 1
             ), f"[Twilight Princess] {shadow_crystal_item_s=}"
-            shadow_crystal_item_copy = deepcopy(shadow_crystal_item_s)
-            fill_restrictive(
-                self.multiworld,
-                collection_state_base,
-                locations,
-                shadow_crystal_item_s,
-                single_player_placement=True,
-                lock=True,
-                allow_excluded=True,
-                # allow_partial=True,
+            shadow_crystal = shadow_crystal_item_s[0]
+
+            # Only what the player starts with (and what that unlocks) can be used to find it
+            collection_state_base.sweep_for_advancements(
+                self.multiworld.get_filled_locations(self.player)
             )
-            assert (
-                len(shadow_crystal_item_s) == 0
-            ), "[Twilight Princess] Shadow crystal not placed"
-            pre_fill_items.remove(shadow_crystal_item_copy[0])
+            locations = get_early_crystal_locations(
+                self, collection_state_base, shadow_crystal
+            )
+            if not locations:
+                raise FillError(
+                    f"[Twilight Princess] No location for the early Shadow Crystal for player {self.player}"
+                )
+
+            self.multiworld.random.choice(locations).place_locked_item(shadow_crystal)
 
             locations = None
 
+        # Find out now if the dungeon items can't fit, not after trying to place them
+        check_prefill_feasibility(self, pre_fill_items)
+
         # Add everything from the item pool to allow for full access
         for item in self.progression_pool:
-            collection_state_base.collect(self.create_item(item))
+            collection_state_base.collect(self.get_logic_item(item), True)
 
         # If faron woods is closed open it so that dungeons can be accessed
         if self.options.faron_woods_logic == FaronWoodsLogic.option_closed:
-            collection_state_base.collect(self.boss_defeat_items["Diababa"])
+            collection_state_base.collect(self.boss_defeat_items["Diababa"], True)
 
         # No need to consider other players items
         # for player in self.multiworld.player_ids:
@@ -629,15 +644,9 @@ class TPWorld(World):
 
         # region DugeonItem-Setup
 
-        collection_state_small_key = collection_state_base.copy()
-        collection_state_big_key = collection_state_base.copy()
-        collection_state_map_and_compass = collection_state_base.copy()
-
-        collection_states = [
-            collection_state_small_key,
-            collection_state_big_key,
-            collection_state_map_and_compass,
-        ]
+        # Each dungeon item category gets a layer on the base state, only the categories that are pre filled get built
+        collection_states = PrefillStates(collection_state_base, self.player)
+        layers = ["Small Keys", "Big Keys", "Maps and Compasses"]
 
         # Fill collection states, b/c if small keys are in the prefill pool then they are not in the item_pool
         # and Big Keys need small keys to define access, similar for map and compass etc
@@ -645,47 +654,43 @@ class TPWorld(World):
             for dungeon_name in VANILLA_SMALL_KEYS_LOCATIONS:
                 for item_name in VANILLA_SMALL_KEYS_LOCATIONS[dungeon_name]:
                     assert (
-                        item_name in self.prefill_pool
+                        item_name in pre_fill_items.names
                     ), f"[Twilight Princess] {item_name=} not in prefill pool"
                     for _ in range(
                         len(VANILLA_SMALL_KEYS_LOCATIONS[dungeon_name][item_name])
                     ):
-                        collection_state_big_key.collect(self.create_item(item_name))
-                        collection_state_map_and_compass.collect(
-                            self.create_item(item_name)
-                        )
+                        item = self.get_logic_item(item_name)
+                        collection_states.add("Big Keys", item)
+                        collection_states.add("Maps and Compasses", item)
 
         if self.options.big_key_settings.in_dungeon:
             for dungeon_name in VANILLA_BIG_KEY_LOCATIONS:
                 for item_name in VANILLA_BIG_KEY_LOCATIONS[dungeon_name]:
                     assert (
-                        item_name in self.prefill_pool
+                        item_name in pre_fill_items.names
                     ), f"[Twilight Princess] {item_name=} not in prefill pool"
                     for _ in range(
                         len(VANILLA_BIG_KEY_LOCATIONS[dungeon_name][item_name])
                     ):
                         # This could deal with small keys on bosses but I think item rules would be better
-                        # collection_state_small_key.collect(self.create_item(item_name))
-                        collection_state_map_and_compass.collect(
-                            self.create_item(item_name)
+                        # collection_states.add("Small Keys", item)
+                        collection_states.add(
+                            "Maps and Compasses", self.get_logic_item(item_name)
                         )
 
         if self.options.map_and_compass_settings.in_dungeon:
             for dungeon_name in VANILLA_MAP_AND_COMPASS_LOCATIONS:
                 for item_name in VANILLA_MAP_AND_COMPASS_LOCATIONS[dungeon_name]:
                     assert (
-                        item_name in self.prefill_pool
+                        item_name in pre_fill_items.names
                     ), f"[Twilight Princess] {item_name=} not in prefill pool"
                     # Realisticlly this is not needed
                     for _ in range(
                         len(VANILLA_MAP_AND_COMPASS_LOCATIONS[dungeon_name][item_name])
                     ):
-                        collection_state_small_key.collect(self.create_item(item_name))
-                        collection_state_big_key.collect(self.create_item(item_name))
-
-        collection_state_small_key.sweep_for_advancements()
-        collection_state_big_key.sweep_for_advancements()
-        collection_state_map_and_compass.sweep_for_advancements()
+                        item = self.get_logic_item(item_name)
+                        collection_states.add("Small Keys", item)
+                        collection_states.add("Big Keys", item)
 
         # All the information about what is to be pre filled is stored here to condense code
         options = [
@@ -702,43 +707,36 @@ class TPWorld(World):
 
         for dungeon_name in VANILLA_SMALL_KEYS_LOCATIONS:
             for item_name in VANILLA_SMALL_KEYS_LOCATIONS[dungeon_name]:
-                assert collection_state_big_key.has(
-                    item_name,
-                    self.player,
-                    len(VANILLA_SMALL_KEYS_LOCATIONS[dungeon_name][item_name]) - 1,
-                ), f"[Twilight Princess] {item_name} not in big key state count={collection_state_big_key.count(item_name,self.player)}"
-                assert collection_state_map_and_compass.has(
-                    item_name,
-                    self.player,
-                    len(VANILLA_SMALL_KEYS_LOCATIONS[dungeon_name][item_name]) - 1,
-                ), f"[Twilight Princess] {item_name} not in MnC state count={collection_state_map_and_compass.count(item_name,self.player)}"
+                for layer in ["Big Keys", "Maps and Compasses"]:
+                    count = collection_states.count(layer, item_name)
+                    assert (
+                        count
+                        >= len(VANILLA_SMALL_KEYS_LOCATIONS[dungeon_name][item_name])
+                        - 1
+                    ), f"[Twilight Princess] {item_name} not in {layer} state {count=}"
 
         for dungeon_name in VANILLA_BIG_KEY_LOCATIONS:
             for item_name in VANILLA_BIG_KEY_LOCATIONS[dungeon_name]:
                 # TODO Figure out precollected items with this
-                # assert not collection_state_small_key.has(
-                #     item_name,
-                #     self.player,
-                #     len(VANILLA_BIG_KEY_LOCATIONS[dungeon_name][item_name]) - 1,
-                # ), f"[Twilight Princess] {item_name} in small key state count={collection_state_small_key.count(item_name,self.player)}"
-                assert collection_state_map_and_compass.has(
-                    item_name,
-                    self.player,
-                    len(VANILLA_BIG_KEY_LOCATIONS[dungeon_name][item_name]) - 1,
-                ), f"[Twilight Princess] {item_name} not in MnC state count={collection_state_map_and_compass.count(item_name,self.player)}"
+                # assert collection_states.count("Small Keys", item_name) < len(
+                #     VANILLA_BIG_KEY_LOCATIONS[dungeon_name][item_name]
+                # ) - 1, f"[Twilight Princess] {item_name} in small key state"
+                count = collection_states.count("Maps and Compasses", item_name)
+                assert (
+                    count >= len(VANILLA_BIG_KEY_LOCATIONS[dungeon_name][item_name]) - 1
+                ), f"[Twilight Princess] {item_name} not in Maps and Compasses state {count=}"
 
         for dungeon_name in VANILLA_MAP_AND_COMPASS_LOCATIONS:
             for item_name in VANILLA_MAP_AND_COMPASS_LOCATIONS[dungeon_name]:
-                assert collection_state_big_key.has(
-                    item_name,
-                    self.player,
-                    len(VANILLA_MAP_AND_COMPASS_LOCATIONS[dungeon_name][item_name]) - 1,
-                ), f"[Twilight Princess] {item_name} not in big key state count={collection_state_big_key.count(item_name,self.player)}"
-                assert collection_state_small_key.has(
-                    item_name,
-                    self.player,
-                    len(VANILLA_MAP_AND_COMPASS_LOCATIONS[dungeon_name][item_name]) - 1,
-                ), f"[Twilight Princess] {item_name} not in small key state count={collection_state_small_key.count(item_name,self.player)}"
+                for layer in ["Big Keys", "Small Keys"]:
+                    count = collection_states.count(layer, item_name)
+                    assert (
+                        count
+                        >= len(
+                            VANILLA_MAP_AND_COMPASS_LOCATIONS[dungeon_name][item_name]
+                        )
+                        - 1
+                    ), f"[Twilight Princess] {item_name} not in {layer} state {count=}"
 
         # endregion
 
@@ -747,15 +745,10 @@ class TPWorld(World):
         dungeon_name = None
         item_name = None
 
-        def on_place(location):
-            # logging.info(location.name)
-            pass
-
         # Place Vanilla items first so that they are ensured to be placed correctly
-        for option, setting, vanilla, state in zip(
-            options, settings, vanillas, collection_states
-        ):
+        for option, setting, vanilla, layer in zip(options, settings, vanillas, layers):
             if option.value == setting.option_vanilla:
+                state = collection_states.get(layer)
                 for dungeon_name in vanilla:
                     for item_name in vanilla[dungeon_name]:
 
@@ -763,12 +756,10 @@ class TPWorld(World):
                             item_name in ITEM_TABLE
                         ), f"[Twilight Princess] {item_name=}"
                         assert (
-                            item_name in self.prefill_pool
+                            item_name in pre_fill_items.names
                         ), f"[Twilight Princess] {item_name=}"
 
-                        items = list(
-                            filter(lambda item: item.name == item_name, pre_fill_items)
-                        )
+                        items = pre_fill_items.take(item_name)
 
                         assert isinstance(
                             items, list
@@ -822,24 +813,18 @@ class TPWorld(World):
 
                         for item, location in zip(items, locations):
                             location.place_locked_item(item)
-                            pre_fill_items.remove(item)
                             state.collect(item)
 
             # sanity check
             dungeon_name = None
             item_name = None
 
-        for option, setting, vanilla, state in zip(
-            options, settings, vanillas, collection_states
-        ):
+        for option, setting, vanilla, layer in zip(options, settings, vanillas, layers):
             if option.value == setting.option_own_dungeon:
+                state = collection_states.get(layer)
                 for dungeon_name in vanilla:
 
-                    locations_base = [
-                        self.get_location(location)
-                        for location, data in LOCATION_TABLE.items()
-                        if data.stage_id.value == dungeon_name
-                    ]
+                    locations_base = self.get_stage_locations(TPStages(dungeon_name))
                     locations = [
                         location
                         for location in locations_base
@@ -854,11 +839,9 @@ class TPWorld(World):
 
                     for item_name in vanilla[dungeon_name]:
                         assert item_name in ITEM_TABLE
-                        assert item_name in self.prefill_pool
+                        assert item_name in pre_fill_items.names
 
-                        new_items = list(
-                            filter(lambda item: item.name == item_name, pre_fill_items)
-                        )
+                        new_items = pre_fill_items.take(item_name)
 
                         assert isinstance(
                             new_items, list
@@ -880,53 +863,44 @@ class TPWorld(World):
                     if dungeon_name == "Palace of Twilight":
                         state_copy = state.copy()
                         if not state.has("Arbiters Grounds Big Key", self.player):
-                            state.collect(self.create_item("Arbiters Grounds Big Key"))
+                            state.collect(
+                                self.get_logic_item("Arbiters Grounds Big Key"), True
+                            )
                         if not state.has("Arbiters Grounds Small Key", self.player, 5):
                             for _ in range(5):
                                 state.collect(
-                                    self.create_item("Arbiters Grounds Small Key")
+                                    self.get_logic_item("Arbiters Grounds Small Key"),
+                                    True,
                                 )
 
-                        if (
-                            self.options.palace_requirements
-                            == PalaceRequirements.option_vanilla
-                        ):
-                            state.collect(self.boss_defeat_items["Argorok"])
+                        for item in get_required_boss_items(self, dungeon_name):
+                            state.collect(item, True)
                         state.sweep_for_advancements()
 
                     elif dungeon_name == "Hyrule Castle":
                         state_copy = state.copy()
 
-                        if (
-                            self.options.castle_requirements
-                            == CastleRequirements.option_all_dungeons
-                        ):
-                            for name, item in self.boss_defeat_items.items():
-                                state.collect(item)
-                        elif (
-                            self.options.castle_requirements
-                            == CastleRequirements.option_vanilla
-                        ):
-                            state.collect(self.boss_defeat_items["Zant"])
+                        for item in get_required_boss_items(self, dungeon_name):
+                            state.collect(item, True)
                         state.sweep_for_advancements()
 
                     assert len(locations) >= len(
                         items
                     ), f"[Twilight Princess] (Own Dungeon) There are not enough locations for items with {setting.display_name=} in {dungeon_name=} acording to final counts {locations=}, {items=}"
 
-                    items_copy = deepcopy(items)
-                    self.multiworld.random.shuffle(items_copy)
+                    # The fill empties items, keep the same item objects to collect once they are placed
+                    placed_items = list(items)
+                    self.multiworld.random.shuffle(placed_items)
                     self.multiworld.random.shuffle(locations)
 
-                    fill_restrictive(
-                        self.multiworld,
+                    # Only this dungeon matters so try the dungeon local fill before the full one
+                    place_dungeon_items(
+                        self,
                         state,
                         locations,
                         items,
-                        single_player_placement=True,
-                        lock=True,
-                        allow_excluded=True,
-                        on_place=on_place,
+                        f"{dungeon_name} {setting.display_name}",
+                        local=True,
                     )
 
                     # All items should be placed
@@ -938,52 +912,25 @@ class TPWorld(World):
                     if state_copy:
                         state = state_copy
 
-                    for item in items_copy:
-                        pre_fill_items.remove(item)
+                    for item in placed_items:
                         state.collect(item)
 
             # sanity check
             dungeon_name = None
             item_name = None
 
-        for option, setting, vanilla, state in zip(
-            options, settings, vanillas, collection_states
-        ):
+        for option, setting, vanilla, layer in zip(options, settings, vanillas, layers):
             if option.value == setting.option_any_dungeon:
+                state = collection_states.get(layer)
                 items = []
                 locations = []
-                skip_hyrule_castle = False
-                skip_palace_of_twilight = False
-                skip_forest_temple = False
+                skipped_dungeons = get_own_dungeon_exceptions(self)
                 for dungeon_name in vanilla:
 
-                    if dungeon_name == "Hyrule Castle":
-                        if self.options.castle_requirements.value in [
-                            CastleRequirements.option_vanilla,
-                            CastleRequirements.option_all_dungeons,
-                        ]:
-                            skip_hyrule_castle = True
-                            continue
-                    elif dungeon_name == "Palace of Twilight":
-                        if (
-                            self.options.palace_requirements.value
-                            == PalaceRequirements.option_vanilla
-                        ):
-                            skip_palace_of_twilight = True
-                            continue
-                    elif dungeon_name == "Forest Temple":
-                        if (
-                            self.options.faron_woods_logic
-                            == FaronWoodsLogic.option_closed
-                        ):
-                            skip_forest_temple = True
-                            continue
-
-                    locations_base = [
-                        self.get_location(location)
-                        for location, data in LOCATION_TABLE.items()
-                        if data.stage_id.value == dungeon_name
-                    ]
+                    if dungeon_name in skipped_dungeons:
+                        continue
+
+                    locations_base = self.get_stage_locations(TPStages(dungeon_name))
                     new_locations = [
                         location
                         for location in locations_base
@@ -999,11 +946,9 @@ class TPWorld(World):
 
                     for item_name in vanilla[dungeon_name]:
                         assert item_name in ITEM_TABLE
-                        assert item_name in self.prefill_pool
+                        assert item_name in pre_fill_items.names
 
-                        new_items = list(
-                            filter(lambda item: item.name == item_name, pre_fill_items)
-                        )
+                        new_items = pre_fill_items.take(item_name)
 
                         assert isinstance(
                             new_items, list
@@ -1024,19 +969,18 @@ class TPWorld(World):
                     items
                 ), f"[Twilight Princess] (Any Dungeon) There are not enough locations for items with {setting.display_name=} in {dungeon_name=} acording to final counts {locations=}, {items=}"
 
-                items_copy = deepcopy(items)
+                # The fill empties items, keep the same item objects to collect once they are placed
+                placed_items = list(items)
                 self.multiworld.random.shuffle(items)
                 self.multiworld.random.shuffle(locations)
 
-                fill_restrictive(
-                    self.multiworld,
+                place_dungeon_items(
+                    self,
                     state,
                     locations,
                     items,
-                    single_player_placement=True,
-                    lock=True,
-                    allow_excluded=True,
-                    on_place=on_place,
+                    f"any dungeon {setting.display_name}",
+                    local=False,
                 )
 
                 # All items should be placed
@@ -1044,26 +988,14 @@ class TPWorld(World):
                     len(items) == 0
                 ), f"[Twilight Princess] (Any dungeon) Not all items placed {items=}"
 
-                for item in items_copy:
-                    pre_fill_items.remove(item)
+                for item in placed_items:
                     state.collect(item)
 
                 # Now deal with POT and HC items
                 # Which will be own_dungeon
-                skipped_dungeons = []
-                if skip_hyrule_castle:
-                    skipped_dungeons.append("Hyrule Castle")
-                if skip_palace_of_twilight:
-                    skipped_dungeons.append("Palace of Twilight")
-                if skip_forest_temple:
-                    skipped_dungeons.append("Forest Temple")
                 for dungeon_name in skipped_dungeons:
 
-                    locations_base = [
-                        self.get_location(location)
-                        for location, data in LOCATION_TABLE.items()
-                        if data.stage_id.value == dungeon_name
-                    ]
+                    locations_base = self.get_stage_locations(TPStages(dungeon_name))
                     locations = [
                         location
                         for location in locations_base
@@ -1078,11 +1010,9 @@ class TPWorld(World):
 
                     for item_name in vanilla[dungeon_name]:
                         assert item_name in ITEM_TABLE
-                        assert item_name in self.prefill_pool
+                        assert item_name in pre_fill_items.names
 
-                        new_items = list(
-                            filter(lambda item: item.name == item_name, pre_fill_items)
-                        )
+                        new_items = pre_fill_items.take(item_name)
 
                         assert isinstance(
                             new_items, list
@@ -1104,52 +1034,44 @@ class TPWorld(World):
                     if dungeon_name == "Palace of Twilight":
                         state_copy = state.copy()
                         if not state.has("Arbiters Grounds Big Key", self.player):
-                            state.collect(self.create_item("Arbiters Grounds Big Key"))
+                            state.collect(
+                                self.get_logic_item("Arbiters Grounds Big Key"), True
+                            )
                         if not state.has("Arbiters Grounds Small Key", self.player, 5):
                             for _ in range(5):
                                 state.collect(
-                                    self.create_item("Arbiters Grounds Small Key")
+                                    self.get_logic_item("Arbiters Grounds Small Key"),
+                                    True,
                                 )
 
-                        if (
-                            self.options.palace_requirements
-                            == PalaceRequirements.option_vanilla
-                        ):
-                            state.collect(self.boss_defeat_items["Argorok"])
+                        for item in get_required_boss_items(self, dungeon_name):
+                            state.collect(item, True)
                         state.sweep_for_advancements()
 
                     elif dungeon_name == "Hyrule Castle":
                         state_copy = state.copy()
 
-                        if (
-                            self.options.castle_requirements
-                            == CastleRequirements.option_all_dungeons
-                        ):
-                            for name, item in self.boss_defeat_items.items():
-                                state.collect(item)
-                        elif (
-                            self.options.castle_requirements
-                            == CastleRequirements.option_vanilla
-                        ):
-                            state.collect(self.boss_defeat_items["Zant"])
+                        for item in get_required_boss_items(self, dungeon_name):
+                            state.collect(item, True)
+                        state.sweep_for_advancements()
 
                     assert len(locations) >= len(
                         items
                     ), f"[Twilight Princess] (Any-Own Dungeon) There are not enough locations for items with {setting.display_name=} in {dungeon_name=} acording to final counts {locations=}, {items=}"
 
-                    items_copy = deepcopy(items)
-                    self.multiworld.random.shuffle(items_copy)
+                    # The fill empties items, keep the same item objects to collect once they are placed
+                    placed_items = list(items)
+                    self.multiworld.random.shuffle(placed_items)
                     self.multiworld.random.shuffle(locations)
 
-                    fill_restrictive(
-                        self.multiworld,
+                    # Only this dungeon matters so try the dungeon local fill before the full one
+                    place_dungeon_items(
+                        self,
                         state,
                         locations,
                         items,
-                        single_player_placement=True,
-                        lock=True,
-                        allow_excluded=True,
-                        on_place=on_place,
+                        f"{dungeon_name} {setting.display_name}",
+                        local=True,
                     )
 
                     # All items should be placed
@@ -1161,8 +1083,7 @@ class TPWorld(World):
                     if state_copy:
                         state = state_copy
 
-                    for item in items_copy:
-                        pre_fill_items.remove(item)
+                    for item in placed_items:
                         state.collect(item)
 
             # sanity check
@@ -1178,167 +1099,7 @@ class TPWorld(World):
     def post_fill(self):
         # As part of (semi-)tiger beetle style test ensure things worked Properly in prod
         # This Allows for easy fuzzing to test find bugs
-        for location_name, data in LOCATION_TABLE.items():
-            location = self.get_location(location_name)
-            assert isinstance(location.item, Item)
-
-            # Poe (Vanilla when not Shuffled) (ignore Jovani)
-            if (
-                not self.options.poe_shuffled
-                and (data.flags & TPFlag.Poe) == TPFlag.Poe
-                and not (data.flags & TPFlag.Npc) == TPFlag.Npc
-            ):
-                # Catches Dungeon Poes as well
-                assert (
-                    location.item.name == "Poe Soul"
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} does not have a Poe Soul it has {location.item}"
-                assert (
-                    location.name in VANILLA_POE_LOCATIONS
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} has a Poe Soul but poes not shuffled"
-
-            # Bugs (Vanilla when not Shuffled) (ignore agitha)
-            if (
-                not self.options.golden_bugs_shuffled
-                and (data.flags & TPFlag.Bug) == TPFlag.Bug
-                and not (data.flags & TPFlag.Npc) == TPFlag.Npc
-            ):
-                assert (
-                    location.item.name in item_name_groups["Bugs"]
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} does not have a Golden Bug it has {location.item}"
-                assert (
-                    location.name in VANILLA_GOLDEN_BUG_LOCATIONS.values()
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} has a Golden Bug but bugs not shuffled"
-
-            # Hidden Skill (Excluded when not Shuffled)
-            if (
-                not self.options.hidden_skills_shuffled
-                and (data.flags & TPFlag.Skill) == TPFlag.Skill
-            ):
-                assert (
-                    location.progress_type == LocationProgressType.EXCLUDED
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but hidden_skill not shuffled"
-
-            # Sky Book (Vanilla when not Shuffled)
-            if (
-                not self.options.sky_characters_shuffled
-                and (data.flags & TPFlag.Sky_Book) == TPFlag.Sky_Book
-            ):
-                if "Sky Character" not in location.name:
-                    assert (
-                        location.progress_type == LocationProgressType.EXCLUDED
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but Sky Characters not shuffled"
-
-                else:
-                    assert (
-                        location.item.name == "Progressive Sky Book"
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} does not have a Sky Character it has {location.item}"
-                    assert (
-                        location.name in VANILLA_SKY_CHARACTER_LOCATIONS
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has a Sky Character but they are not shuffled"
-
-            # Heart (Excluded when not Shuffled) (Do not Consider Boss heart containers)
-            if (
-                not self.options.heart_piece_shuffled
-                and (data.flags & TPFlag.Heart) == TPFlag.Heart
-                and not (data.flags & TPFlag.Boss) == TPFlag.Boss
-            ):
-                assert (
-                    location.progress_type == LocationProgressType.EXCLUDED
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but Heart Pieces not shuffled"
-
-            # Shop (Excluded when not Shuffled)
-            if (
-                not self.options.shop_items_shuffled
-                and (data.flags & TPFlag.Shop) == TPFlag.Shop
-            ):
-                assert (
-                    location.progress_type == LocationProgressType.EXCLUDED
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but Shop not shuffled"
-
-            # NPC (Excluded when not Shuffled)
-            if (
-                not self.options.npc_items_shuffled
-                and (data.flags & TPFlag.Npc) == TPFlag.Npc
-            ):
-                # Handle Agitha
-                if (data.flags & TPFlag.Bug) == TPFlag.Bug:
-                    if not self.options.golden_bugs_shuffled:
-                        assert (
-                            location.progress_type == LocationProgressType.EXCLUDED
-                        ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but NPC's not shuffled"
-                # Handle Jovani
-                if (data.flags & TPFlag.Poe) == TPFlag.Poe:
-                    if not self.options.poe_shuffled:
-                        assert (
-                            location.progress_type == LocationProgressType.EXCLUDED
-                        ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but NPC's not shuffled"
-
-                assert (
-                    location.progress_type == LocationProgressType.EXCLUDED
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but NPC's not shuffled"
-
-            # Story (Vanilla items, no other locations should have the items)
-            match (location.name):
-                case "Renados Letter":
-                    assert (
-                        location.item.name == "Renado's Letter"
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has {location.item.name}"
-                case "Telma Invoice":
-                    assert (
-                        location.item.name == "Invoice"
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has {location.item.name}"
-                case "Wooden Statue":
-                    assert (
-                        location.item.name == "Wooden Statue"
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has {location.item.name}"
-                case "Ilias Charm":
-                    assert (
-                        location.item.name == "Ilias Charm"
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has {location.item.name}"
-                case "Ilia Memory Reward":
-                    assert (
-                        location.item.name == "Horse Call"
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has {location.item.name}"
-
-            # Dungeon (Check Only Dungeon Locations)
-            if not self.options.dungeons_shuffled and data.flags == TPFlag.Dungeon:
-                assert (
-                    location.progress_type == LocationProgressType.EXCLUDED
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but Dungeons not shuffled"
-
-            # Boss / Mini Boss
-            if (data.flags & TPFlag.Boss) == TPFlag.Boss:
-                # Dungeon Rewards (Becomes Priority)
-                if self.options.dungeon_rewards_progression:  # or mini boss if made so
-                    assert (
-                        location.progress_type == LocationProgressType.PRIORITY
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but Dungeons rewards are progression"
-                # (Default check of dungeon)
-                else:
-                    if not self.options.dungeons_shuffled:
-                        assert (
-                            location.progress_type == LocationProgressType.EXCLUDED
-                        ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but Dungeons not shuffled"
-
-                # Small Keys On Bosses (Check Item)
-                if not self.options.small_keys_on_bosses:
-                    assert (
-                        location.item.name not in item_name_groups["Small Keys"]
-                    ), f"[Twilight Princess] (Post Fill Error) {location.name} has {location.item} but small keys are not on bosses"
-
-            # Small Key
-
-            # Big Key
-
-            # M&C
-
-            # Overworld (Check only overworld flagged locations)
-            if not self.options.overworld_shuffled and data.flags == TPFlag.Overworld:
-                assert (
-                    location.progress_type == LocationProgressType.EXCLUDED
-                ), f"[Twilight Princess] (Post Fill Error) {location.name} is {location.progress_type} but OverWorld not shuffled"
-
-            # Early Shadow Crystal
+        check_post_fill(self)
 
         return super().post_fill()
 
@@ -1360,6 +1121,7 @@ class TPWorld(World):
             "ItemPlacement": item_str,
             "Debug": {
                 "settings": self.get_settings_map(),
+                "LogicStats": dict(self.logic_stats),
                 "ItemPlacements": {},
             },
         }
@@ -1480,82 +1242,54 @@ class TPWorld(World):
             name,
             self.player,
             ITEM_TABLE[name],
-            self.determine_item_classification(name),
+            self.get_item_classification(name),
         )
 
+    def get_item_classification(self, name: str) -> IC | None:
+        """Get the classification override of an item, determine_item_classification is only run once per name."""
+        if name not in self.item_classifications:
+            self.item_classifications[name] = self.determine_item_classification(name)
+        return self.item_classifications[name]
+
+    def get_logic_item(self, name: str) -> TPItem:
+        """Get the one item of this name that is only collected into states, never placed."""
+        if name not in self.logic_items:
+            self.logic_items[name] = self.create_item(name)
+        return self.logic_items[name]
+
     def get_filler_item_name(self) -> str:
         """
         This method is called when the item pool needs to be filled with additional items to match the location count.
 
         :return: The name of a filler item from this world.
         """
+        return self.get_filler_item_names(1)[0]
 
-        # If there are still useful items to place, place those first.
-        if len(self.useful_pool) > 0:
-            return self.useful_pool.pop()
-
-        # If there are still vanilla filler items to place, place those first.
-        if len(self.filler_pool) > 0:
-            return self.filler_pool.pop()
-
-        assert len(self.useful_pool) == 0
-        assert len(self.filler_pool) == 0
-
-        # Use the same weights for filler items used in the base randomizer.
-        filler_consumables = [
-            # "Green Rupee",
-            # "Blue Rupee",
-            # "Yellow Rupee",
-            # "Red Rupee",
-            "Purple Rupee",
-            "Orange Rupee",
-            "Silver Rupee",
-            # "Arrows (10)",
-            # "Arrows (20)",
-            "Arrows (30)",
-            "Seeds (50)",
-            # "Bombs (5)",
-            # "Bombs (10)",
-            # "Bombs (20)",
-            "Bombs (30)",
-            # "Bomblings (3)",
-            # "Bomblings (5)",
-            "Bomblings (10)",
-            # "Water Bombs (3)",
-            # "Water Bombs (5)",
-            "Water Bombs (10)",
-            "Ice Trap",
-        ]
-        filler_weights = [
-            # 1,  # Green Rupee
-            # 2,  # Blue Rupee
-            # 3,  # Yellow Rupee
-            # 1,  # Red Rupee
-            2,  # Purple Rupee
-            3,  # Orange Rupee
-            2,  # Silver Rupee
-            # 1,  # Arrows 10
-            # 2,  # Arrows 20
-            1,  # Arrows 30
-            1,  # Seeds 50
-            # 1,  # Bombs 5
-            # 2,  # Bombs 10
-            # 2,  # Bombs 20
-            1,  # Bombs 30
-            # 1,  # Bomblings 3
-            # 2,  # Bomblings 5
-            1,  # Bomblings 10
-            # 1,  # Water Bombs 3
-            # 2,  # Water Bombs 5
-            1,  # Water Bombs 10
-            self.options.trap_frequency.value,  # Ice Trap
-        ]
-        assert len(filler_consumables) == len(
-            filler_weights
-        ), f"[Twilight Princess] {len(filler_consumables)=}, {len(filler_weights)=}"
-        return self.multiworld.random.choices(
-            filler_consumables, weights=filler_weights, k=1
-        )[0]
+    def get_filler_item_names(self, count: int) -> list[str]:
+        """
+        Get the names of several filler items at once, the same names get_filler_item_name would give for count calls.
+
+        :param count: The number of filler items.
+        :return: The names of the filler items from this world.
+        """
+        names: list[str] = []
+
+        # If there are still useful items to place, place those first. Then the vanilla filler items.
+        for pool in (self.useful_pool, self.filler_pool):
+            taken = min(count - len(names), len(pool))
+            if taken > 0:
+                names.extend(reversed(pool[-taken:]))
+                del pool[-taken:]
+
+        # Draw the rest from the consumables, one random number each like separate choices(k=1) calls
+        if len(names) < count:
+            filler_consumables, cum_weights = get_filler_table(self)
+            names.extend(
+                self.multiworld.random.choices(
+                    filler_consumables, cum_weights=cum_weights, k=count - len(names)
+                )
+            )
+        return names
 
     def get_pre_fill_items(self) -> list[Item]:
         """
@@ -1597,6 +1331,18 @@ class TPWorld(World):
         :param remove: indicate if this is meant to remove from state instead of adding.
         """
         if item.advancement:
+            # Invalidates the room set reachability memo of the state
+            state._tp_item_version[self.player] += 1
+            index = TP_ITEM_INDEX.get(item.name)
+            if index is not None:
+                # Rules that check this item have to be evaluated again
+                state._tp_known_false[self.player] &= ~self.item_rule_masks[index]
+                counts = state._tp_item_counts[self.player]
+                if remove:
+                    # prog_items drops the entry once it is below 1
+                    counts[index] = max(counts[index] - 1, 0)
+                else:
+                    counts[index] += 1
             return item.name
         return None
 
@@ -0,0 +1,189 @@
+from random import Random
+
+from BaseClasses import CollectionState
+
+from worlds.twilight_princess_apworld.Items import TP_ITEM_INDEX
+from worlds.twilight_princess_apworld.Logic.Macros import can_change_time
+from worlds.twilight_princess_apworld.Logic.RuleCompiler import is_always_true
+from worlds.twilight_princess_apworld.Logic.RuleDependencies import (
+    get_region_dependencies,
+)
+from worlds.twilight_princess_apworld.options import *
+from worlds.twilight_princess_apworld.RoomFunctions import RoomFunctions
+from . import TwilightPrincessWorldTestBase
+
+
+class TestLogic(TwilightPrincessWorldTestBase):
+
+    def get_random_states(self, count: int) -> list[CollectionState]:
+        random = Random(self.multiworld.seed)
+        progression = [
+            item
+            for item in self.multiworld.itempool
+            if item.player == self.player and item.advancement
+        ]
+
+        states = []
+        for _ in range(count):
+            state = CollectionState(self.multiworld)
+            for item in random.sample(progression, random.randint(0, len(progression))):
+                state.collect(item, True)
+            states.append(state)
+        return states
+
+    def assert_compiled_rules_match(self) -> None:
+        spots = [
+            *self.multiworld.get_locations(self.player),
+            *self.multiworld.get_entrances(self.player),
+        ]
+        compiled = [spot for spot in spots if hasattr(spot.access_rule, "tp_source")]
+        self.assertTrue(compiled, "No rules were compiled")
+
+        for state in self.get_random_states(20):
+            for spot in compiled:
+                self.assertEqual(
+                    bool(spot.access_rule(state)),
+                    bool(spot.access_rule.tp_source(state)),
+                    f"Compiled rule for {spot.name} does not match its source",
+                )
+
+    def test_compiled_rules_match_glitchless(self):
+        self.options["logic_rules"] = LogicRules.option_glitchless
+        self.world_setup()
+        self.assert_compiled_rules_match()
+
+    def test_compiled_rules_match_glitched(self):
+        self.options["logic_rules"] = LogicRules.option_glitched
+        self.world_setup()
+        self.assert_compiled_rules_match()
+
+    def assert_indirect_conditions_complete(self) -> None:
+        self.assertTrue(self.world.explicit_indirect_conditions)
+        for state in self.get_random_states(20):
+            explicit = state.copy()
+            explicit.update_reachable_regions(self.player)
+
+            # Without explicit indirect conditions every blocked entrance is checked until nothing changes
+            self.world.explicit_indirect_conditions = False
+            try:
+                automatic = state.copy()
+                automatic.update_reachable_regions(self.player)
+            finally:
+                del self.world.explicit_indirect_conditions
+
+            self.assertEqual(
+                explicit.reachable_regions[self.player],
+                automatic.reachable_regions[self.player],
+                "Missing indirect condition",
+            )
+
+    def test_indirect_conditions_glitchless(self):
+        self.options["logic_rules"] = LogicRules.option_glitchless
+        self.world_setup()
+        self.assert_indirect_conditions_complete()
+
+    def test_indirect_conditions_glitched(self):
+        self.options["logic_rules"] = LogicRules.option_glitched
+        self.world_setup()
+        self.assert_indirect_conditions_complete()
+
+    def test_region_dependencies_of_closures(self):
+        self.world_setup()
+
+        def reach(region_name: str):
+            return lambda state: state.can_reach_region(region_name, self.player)
+
+        cache = {}
+        for region in list(self.multiworld.get_regions(self.player))[:2]:
+            self.assertEqual(
+                get_region_dependencies(self.world, reach(region.name), cache),
+                {region.name},
+            )
+
+    def test_room_set_memo(self):
+        self.world_setup()
+        progression = [
+            item
+            for item in self.multiworld.itempool
+            if item.player == self.player and item.advancement
+        ]
+
+        state = CollectionState(self.multiworld)
+        for item in progression:
+            before = state.copy()
+            can_change_time(before, self.player)
+
+            # The copy keeps the memo but must not give stale answers once it has more items
+            state = before.copy()
+            state.collect(item, True)
+            self.assertEqual(
+                state._tp_can_reach_any_region(
+                    self.player, "time_flow_rooms", RoomFunctions.time_flow_rooms
+                ),
+                any(
+                    state.can_reach_region(room, self.player)
+                    for room in RoomFunctions.time_flow_rooms
+                ),
+            )
+
+    def test_item_counts_match_prog_items(self):
+        self.world_setup()
+        state = self.get_random_states(1)[0]
+        copy = state.copy()
+        for item in self.multiworld.itempool[:100]:
+            if item.player == self.player and item.advancement:
+                copy.remove(item)
+
+        for checked in (state, copy):
+            for name, index in TP_ITEM_INDEX.items():
+                self.assertEqual(
+                    checked._tp_item_counts[self.player][index],
+                    checked.prog_items[self.player][name],
+                    name,
+                )
+
+    def test_every_item_is_indexed(self):
+        self.world_setup()
+        for location in self.multiworld.get_filled_locations(self.player):
+            if location.item.player == self.player:
+                self.assertIn(location.item.name, TP_ITEM_INDEX, location.name)
+
+    def test_known_false_rules_are_invalidated(self):
+        self.world_setup()
+        spots = [
+            spot
+            for spot in self.multiworld.get_locations(self.player)
+            if hasattr(spot.access_rule, "tp_source")
+        ]
+        progression = [
+            item
+            for item in self.multiworld.itempool
+            if item.player == self.player and item.advancement
+        ]
+        Random(self.multiworld.seed).shuffle(progression)
+
+        # Evaluate every rule after every change so the known false rules get reused
+        state = CollectionState(self.multiworld)
+        changes = [(item, False) for item in progression]
+        changes += [(item, True) for item in progression[: len(progression) // 2]]
+        for item, remove in changes:
+            if remove:
+                state.remove(item)
+            else:
+                state.collect(item, True)
+            for spot in spots:
+                self.assertEqual(
+                    bool(spot.access_rule(state)),
+                    bool(spot.access_rule.tp_source(state)),
+                    f"{spot.name} after {'removing' if remove else 'collecting'} {item.name}",
+                )
+
+    def test_trivial_rules_are_not_set(self):
+        self.world_setup()
+        self.assertGreater(self.world.logic_stats["trivial_rules"], 0)
+        for spot in [
+            *self.multiworld.get_locations(self.player),
+            *self.multiworld.get_entrances(self.player),
+        ]:
+            if hasattr(spot.access_rule, "tp_source"):
+                self.assertFalse(is_always_true(spot.access_rule), spot.name)
@@ -0,0 +1,259 @@
+from BaseClasses import CollectionState, LocationProgressType
+from Fill import FillError
+
+from worlds.twilight_princess_apworld.Locations import TPStages
+from worlds.twilight_princess_apworld.options import *
+from worlds.twilight_princess_apworld.Randomizer.DungeonFill import (
+    PREFILL_RETRIES,
+    check_prefill_feasibility,
+    fill_dungeon,
+    get_required_boss_items,
+    place_dungeon_items,
+)
+from worlds.twilight_princess_apworld.Randomizer.PostFill import check_post_fill
+from worlds.twilight_princess_apworld.Randomizer.ItemPool import (
+    DUNGEON_TO_BOSS_NAME,
+    PrefillPool,
+    VANILLA_BIG_KEY_LOCATIONS,
+    VANILLA_MAP_AND_COMPASS_LOCATIONS,
+    VANILLA_SMALL_KEYS_LOCATIONS,
+    get_pool_categories,
+    get_sphere_one_locations,
+)
+from . import TwilightPrincessWorldTestBase
+
+
+class TestPrefill(TwilightPrincessWorldTestBase):
+
+    def test_own_dungeon_items_stay_in_their_dungeon(self):
+        self.options["small_key_settings"] = SmallKeySettings.option_own_dungeon
+        self.options["big_key_settings"] = BigKeySettings.option_own_dungeon
+        self.options["map_and_compass_settings"] = (
+            MapAndCompassSettings.option_own_dungeon
+        )
+        self.world_setup()
+
+        for vanilla in (
+            VANILLA_SMALL_KEYS_LOCATIONS,
+            VANILLA_BIG_KEY_LOCATIONS,
+            VANILLA_MAP_AND_COMPASS_LOCATIONS,
+        ):
+            for dungeon_name, dungeon_items in vanilla.items():
+                stage = TPStages(dungeon_name)
+                placed = [
+                    location.item.name
+                    for location in self.world.get_stage_locations(stage)
+                    if location.item is not None
+                ]
+                for item_name, vanilla_locations in dungeon_items.items():
+                    self.assertEqual(
+                        placed.count(item_name),
+                        len(vanilla_locations),
+                        f"{item_name} not placed in {dungeon_name}",
+                    )
+
+    def test_failed_dungeon_fill_places_nothing(self):
+        self.world_setup()
+        state = CollectionState(self.multiworld)
+        for item in self.multiworld.itempool:
+            if item.player == self.player and item.advancement:
+                state.collect(item, True)
+
+        # Two items can be placed before the fill runs out of locations and has to undo them
+        locations = [
+            location
+            for location in self.world.get_stage_locations(TPStages.Forest_Temple)
+            if location.item is None
+            and location.address is not None
+            and location.can_reach(state)
+        ][:2]
+        items = [self.world.create_item("Forest Temple Small Key") for _ in range(3)]
+        locations_before = list(locations)
+        items_before = list(items)
+
+        self.assertFalse(fill_dungeon(state, locations, items))
+
+        self.assertEqual(locations, locations_before)
+        self.assertEqual(items, items_before)
+        for location in locations:
+            self.assertIsNone(location.item)
+            self.assertFalse(location.locked)
+        for item in items:
+            self.assertIsNone(item.location)
+
+    def test_early_shadow_crystal_is_in_sphere_one(self):
+        self.options["early_shadow_crystal"] = True
+        self.world_setup()
+        state = CollectionState(self.multiworld)
+        state.sweep_for_advancements(
+            [
+                location
+                for location in self.multiworld.get_filled_locations(self.player)
+                if location.item.name != "Shadow Crystal"
+            ]
+        )
+
+        crystal_locations = [
+            location
+            for location in self.multiworld.get_filled_locations(self.player)
+            if location.item.name == "Shadow Crystal"
+        ]
+        self.assertEqual(len(crystal_locations), 1)
+        self.assertTrue(crystal_locations[0].can_reach(state))
+
+    def test_sphere_one_locations_need_no_items(self):
+        self.world_setup()
+        state = CollectionState(self.multiworld)
+        for item in self.multiworld.precollected_items[self.player]:
+            state.remove(item)
+
+        locations = get_sphere_one_locations(self.world)
+        self.assertTrue(locations)
+        for location in locations:
+            self.assertTrue(location.can_reach(state), location.name)
+
+    def test_feasibility_check_rejects_full_dungeon(self):
+        self.options["small_key_settings"] = SmallKeySettings.option_own_dungeon
+        self.world_setup()
+        pre_fill_items = PrefillPool(self.world.get_pre_fill_items())
+        check_prefill_feasibility(self.world, pre_fill_items)
+
+        for location in self.world.get_stage_locations(TPStages.Forest_Temple):
+            if location.item is None and location.address is not None:
+                location.place_locked_item(
+                    self.world.create_item(self.world.get_filler_item_name())
+                )
+        with self.assertRaises(FillError):
+            check_prefill_feasibility(self.world, pre_fill_items)
+
+    def test_feasibility_check_rejects_unreachable_boss(self):
+        self.options["small_key_settings"] = SmallKeySettings.option_own_dungeon
+        self.options["palace_requirements"] = PalaceRequirements.option_vanilla
+        self.world_setup()
+        pre_fill_items = PrefillPool(self.world.get_pre_fill_items())
+        check_prefill_feasibility(self.world, pre_fill_items)
+
+        self.world.get_location("City in The Sky Argorok").access_rule = (
+            lambda state: False
+        )
+        with self.assertRaises(FillError):
+            check_prefill_feasibility(self.world, pre_fill_items)
+
+    def test_failed_prefill_is_retried_and_rolled_back(self):
+        self.world_setup()
+        state = CollectionState(self.multiworld)
+        for item in self.multiworld.itempool:
+            if item.player == self.player and item.advancement:
+                state.collect(item, True)
+
+        # Can never work, there is one more item than there are locations
+        locations = [
+            location
+            for location in self.world.get_stage_locations(TPStages.Forest_Temple)
+            if location.item is None
+            and location.address is not None
+            and location.can_reach(state)
+        ][:2]
+        items = [self.world.create_item("Forest Temple Small Key") for _ in range(3)]
+        progress_types = [location.progress_type for location in locations]
+
+        with self.assertLogs(level="WARNING") as logs:
+            with self.assertRaises(FillError):
+                place_dungeon_items(
+                    self.world, state, locations, items, "test", local=True
+                )
+        self.assertEqual(len(logs.records), PREFILL_RETRIES + 1)
+
+        for location, progress_type in zip(locations, progress_types):
+            self.assertIsNone(location.item)
+            self.assertFalse(location.locked)
+            self.assertEqual(location.progress_type, progress_type)
+        for item in items:
+            self.assertIsNone(item.location)
+
+    def test_logic_items_are_never_placed(self):
+        self.world_setup()
+        logic_items = list(self.world.logic_items.values())
+        self.assertTrue(logic_items, "No logic items were used")
+        self.assertIs(self.world.get_logic_item(logic_items[0].name), logic_items[0])
+
+        placed = {
+            id(location.item) for location in self.multiworld.get_filled_locations()
+        }
+        pooled = {id(item) for item in self.multiworld.itempool}
+        for item in logic_items:
+            self.assertIsNone(item.location, item.name)
+            self.assertNotIn(id(item), placed, item.name)
+            self.assertNotIn(id(item), pooled, item.name)
+
+    def test_boss_locations_reject_forbidden_items(self):
+        self.options["small_keys_on_bosses"] = SmallKeysOnBosses.option_false
+        self.world_setup()
+        location = self.world.get_location("Forest Temple Diababa Heart Container")
+
+        for name in ("Forest Temple Small Key", "Forest Temple Big Key"):
+            self.assertFalse(location.item_rule(self.world.create_item(name)), name)
+        self.assertTrue(location.item_rule(self.world.create_item("Purple Rupee")))
+
+    def test_batched_filler_matches_single_draws(self):
+        self.world_setup()
+        useful_pool = ["Heart Container", "Piece of Heart", "Piece of Heart"]
+        filler_pool = ["Orange Rupee", "Arrows (30)"]
+        random_state = self.multiworld.random.getstate()
+
+        names = []
+        for batched in (False, True):
+            self.world.useful_pool = list(useful_pool)
+            self.world.filler_pool = list(filler_pool)
+            self.multiworld.random.setstate(random_state)
+            if batched:
+                names.append(self.world.get_filler_item_names(40))
+            else:
+                names.append([self.world.get_filler_item_name() for _ in range(40)])
+
+        self.assertEqual(names[0], names[1])
+        self.assertEqual(names[1][:5], [*reversed(useful_pool), *reversed(filler_pool)])
+
+    def test_pool_categories_follow_options(self):
+        self.options["small_key_settings"] = SmallKeySettings.option_startwith
+        self.world_setup()
+        categories = dict(get_pool_categories(self.world))
+
+        self.assertEqual(categories["Forest Temple Small Key"], "precollected")
+        self.assertEqual(categories["Gate Keys"], "precollected")
+        self.assertEqual(categories["Purple Rupee"], "filler")
+        self.assertNotIn("Victory", categories)
+        self.assertIs(get_pool_categories(self.world), get_pool_categories(self.world))
+
+    def test_boss_defeat_items_follow_requirements(self):
+        self.options["castle_requirements"] = CastleRequirements.option_vanilla
+        self.options["palace_requirements"] = PalaceRequirements.option_vanilla
+        self.world_setup()
+
+        for dungeon_name, boss in DUNGEON_TO_BOSS_NAME.items():
+            item = self.world.get_location(f"{dungeon_name} {boss}").item
+            self.assertIs(item, self.world.boss_defeat_items[boss])
+            self.assertEqual(item.name, f"{boss} Defeated")
+        self.assertEqual(
+            get_required_boss_items(self.world, "Hyrule Castle"),
+            [self.world.boss_defeat_items["Zant"]],
+        )
+        self.assertEqual(
+            get_required_boss_items(self.world, "Palace of Twilight"),
+            [self.world.boss_defeat_items["Argorok"]],
+        )
+        self.assertFalse(self.world.boss_defeat_items["Morpheel"].advancement)
+        self.assertTrue(self.world.boss_defeat_items["Stallord"].advancement)
+
+    def test_post_fill_invariants(self):
+        self.options["npc_items_shuffled"] = False
+        self.world_setup()
+        for location in self.multiworld.get_unfilled_locations(self.player):
+            location.place_locked_item(self.world.create_item("Purple Rupee"))
+        check_post_fill(self.world)
+
+        location = self.world.get_location("Agitha Female Ant Reward")
+        self.assertEqual(location.progress_type, LocationProgressType.EXCLUDED)
+        location.progress_type = LocationProgressType.DEFAULT
+        with self.assertRaises(AssertionError):
+            check_post_fill(self.world)